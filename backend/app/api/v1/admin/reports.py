@@ -1,19 +1,22 @@
 from fastapi import APIRouter, Depends, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
+from sqlalchemy.orm import joinedload
 from typing import List
 import uuid
 
 from app.db.session import get_db
+from app.db.filters import jsonb_eq_filter
 from app.models.beacon import Beacon
 # We need a schema that matches what the frontend expects.
 # The frontend Interface Report has: id, status, priority, credibility_score, created_at
-from pydantic import BaseModel, validator
-from datetime import datetime, timezone
-from app.models.beacon_update import BeaconUpdate
+from pydantic import BaseModel
 from app.models.beacon_message import BeaconMessage
-from app.schemas.report import TrackMessage, MessageAttachment, TrackMessageRequest, SecureUploadResponse
+from app.schemas.report import TrackMessage, MessageAttachment, TrackMessageRequest, SecureUploadResponse, UtcZ
 from fastapi import UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+import orjson
 import os
 import hashlib
 from typing import List, Optional, Any
@@ -22,38 +25,29 @@ from app.api.deps import get_current_admin
 router = APIRouter(dependencies=[Depends(get_current_admin)])
 
 
+def _write_file(path: str, content: bytes):
+    with open(path, "wb") as f:
+        f.write(content)
+
+
 class CaseUpdateSchema(BaseModel):
     id: str
     public_update: str
-    created_at: Any
+    created_at: UtcZ
     updated_by: str
 
-    @validator("created_at", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
-
 class AdminReportSchema(BaseModel):
     id: uuid.UUID
     status: str
     priority: str
     credibility_score: Optional[int] = None
-    created_at: Any
+    created_at: UtcZ
     case_id: str
     incident_summary: Optional[str] = None
     app_score_explanation: Optional[str] = None
     evidence_files: Optional[List[dict]] = []
     updates: Optional[List[CaseUpdateSchema]] = []
     
-    @validator("created_at", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
-
     class Config:
         from_attributes = True
 
@@ -62,12 +56,22 @@ class UpdateStatusRequest(BaseModel):
 
 @router.get("/", response_model=List[AdminReportSchema])
 async def get_reports(
+    confidence: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Fetch all reports for the admin dashboard.
+    Optional filters: AI confidence level (Low / Medium / High) and credibility score range.
     """
     query = select(Beacon).order_by(desc(Beacon.reported_at))
+    if confidence:
+        query = query.where(jsonb_eq_filter(Beacon.credibility_breakdown, "confidence", confidence))
+    if min_score is not None:
+        query = query.where(Beacon.credibility_score >= min_score)
+    if max_score is not None:
+        query = query.where(Beacon.credibility_score <= max_score)
     result = await db.execute(query)
     beacons = result.scalars().all()
     
@@ -119,7 +123,9 @@ async def get_report_detail(
     """
     Fetch full detail for a single report.
     """
-    case = await db.get(Beacon, id)
+    # Case + its updates in one round trip
+    stmt = select(Beacon).options(joinedload(Beacon.updates)).where(Beacon.id == id)
+    case = (await db.execute(stmt)).unique().scalar_one_or_none()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
@@ -145,15 +151,8 @@ async def get_report_detail(
     if case.evidence_files:
         evidence = case.evidence_files
 
-    # Fetch Updates
-    updates_stmt = select(BeaconUpdate).where(
-        BeaconUpdate.case_id == case.case_id
-    ).order_by(BeaconUpdate.created_at.asc())
-    updates_result = await db.execute(updates_stmt)
-    updates_objs = updates_result.scalars().all()
-    
     updates_data = []
-    for u in updates_objs:
+    for u in case.updates:
         updates_data.append({
             "id": str(u.id),
             "public_update": u.public_update,
@@ -224,16 +223,12 @@ async def get_case_messages(
     """
     Fetch all messages for a specific case by its UUID.
     """
-    case = await db.get(Beacon, id)
+    # Case + its messages in one round trip
+    stmt = select(Beacon).options(joinedload(Beacon.messages)).where(Beacon.id == id)
+    case = (await db.execute(stmt)).unique().scalar_one_or_none()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
-        
-    stmt = select(BeaconMessage).where(
-        BeaconMessage.case_id == case.case_id
-    ).order_by(BeaconMessage.created_at.asc())
-    
-    result = await db.execute(stmt)
-    messages = result.scalars().all()
+    messages = case.messages
     
     return [
         TrackMessage(
@@ -325,8 +320,7 @@ async def upload_admin_file(
         
         if not file_path:
             local_path = os.path.join(UPLOAD_DIR, unique_filename).replace("\\", "/")
-            with open(local_path, "wb") as f:
-                f.write(content)
+            await run_in_threadpool(_write_file, local_path, content)
             file_path = local_path
             
         return SecureUploadResponse(
@@ -337,6 +331,39 @@ async def upload_admin_file(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
 
+@router.get("/{id}/summary/stream")
+async def stream_case_summary(
+    id: uuid.UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Regenerate the incident summary from the original chat and stream it as
+    Server-Sent Events (one JSON-encoded text delta per event, then [DONE]).
+    """
+    case = await db.get(Beacon, id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found")
+
+    from app.db.local_db import LocalAsyncSession
+    from app.models.local_models import LocalSession
+    from app.services.scoring_service import ScoringService
+    from app.services.ai_service import GroqService
+
+    async with LocalAsyncSession() as local_db:
+        session_id = (await local_db.execute(
+            select(LocalSession.id).where(LocalSession.case_id == case.case_id)
+        )).scalar_one_or_none()
+        if not session_id:
+            raise HTTPException(status_code=404, detail="Original chat session not found")
+        chat_history = await ScoringService._fetch_chat_history(session_id, local_db)
+
+    async def events():
+        async for chunk in GroqService.generate_pro_summary_stream(chat_history):
+            yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
 @router.post("/{id}/analyze", status_code=202)
 async def trigger_reanalysis(
     id: uuid.UUID,
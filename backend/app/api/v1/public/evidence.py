@@ -1,4 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
 import uuid
@@ -14,6 +15,18 @@ router = APIRouter()
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+
+def _sha256_hex(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _save_local(unique_filename: str, content: bytes) -> str:
+    local_path = os.path.join(UPLOAD_DIR, unique_filename)
+    with open(local_path, "wb") as f:
+        f.write(content)
+    return os.path.abspath(local_path)
+
+
 @router.post("/upload")
 async def upload_evidence(
     report_id: str = Form(...),
@@ -29,7 +42,9 @@ async def upload_evidence(
 
     try:
         content = await file.read()
-        file_hash = hashlib.sha256(content).hexdigest()
+        # Hashing and disk writes run in the threadpool (hashlib releases the GIL), keeping
+        # multi-MB uploads from stalling every other request on the event loop
+        file_hash = await run_in_threadpool(_sha256_hex, content)
         
         # Save to local uploads folder
         file_ext = os.path.splitext(file.filename)[1]
@@ -46,16 +61,10 @@ async def upload_evidence(
             except Exception as sup_err:
                 print(f"[UPLOAD] Supabase Upload Failed: {sup_err}. Falling back to local.")
                 # Fallback to local
-                local_path = os.path.join(UPLOAD_DIR, unique_filename)
-                with open(local_path, "wb") as f:
-                    f.write(content)
-                file_path = os.path.abspath(local_path)
+                file_path = await run_in_threadpool(_save_local, unique_filename, content)
         else:
             # DEV: Local Storage
-            local_path = os.path.join(UPLOAD_DIR, unique_filename)
-            with open(local_path, "wb") as f:
-                f.write(content)
-            file_path = os.path.abspath(local_path)
+            file_path = await run_in_threadpool(_save_local, unique_filename, content)
             
         # Track in local SQLite
         async with LocalAsyncSession() as session:
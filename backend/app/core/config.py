@@ -31,6 +31,11 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # App-side pool per worker (ignored behind the Supabase transaction pooler, which pools itself).
+    # Keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the Postgres connection limit.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds
     
     # Supabase Storage & Client
     SUPABASE_URL: str
@@ -40,9 +45,18 @@ class Settings(BaseSettings):
     # AI
     GEMINI_API_KEY: str = ""
     GROQ_API_KEY: str
+    GROQ_MAX_CONCURRENCY: int = 4  # Max in-flight Groq requests per process (rate-limit headroom)
+    GROQ_FAST_MODEL: str = "llama-3.1-8b-instant"  # Translation / entity extraction
+    GROQ_REASONING_MODEL: str = "llama-3.1-8b-instant"  # Summary, forensics, credibility scoring
+    GROQ_CACHE_TTL_SECONDS: int = 86400  # Reuse completions for identical requests (0 disables)
+    GROQ_TRANSCRIPTION_MODEL: str = "whisper-large-v3-turbo"  # Evidence audio/video ("whisper-large-v3" for max accuracy)
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    SQL_LOG_SAMPLE_RATE: float = 0.01  # Fraction of remote DB statements logged (0 disables)
+
+    # Static Uploads (disable when a reverse proxy/CDN serves /uploads)
+    SERVE_UPLOADS: bool = True
 
 
     model_config = SettingsConfigDict(
@@ -1,5 +1,5 @@
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import structlog
@@ -12,7 +12,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     Prevents stack trace leakage in production.
     """
     logger.error("unhandled_exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "An unexpected error occurred. Please contact support."},
     )
@@ -21,7 +21,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     Standard HTTP exception handler.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
     )
@@ -31,7 +31,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     Pydantic validation error handler.
     """
     logger.warning("validation_error", errors=exc.errors(), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": "Validation error", "errors": exc.errors()},
     )
@@ -0,0 +1,15 @@
+from typing import Any
+from sqlalchemy import Column
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def jsonb_eq_filter(column: Column, field: str, value: Any, array_member: bool = False) -> ColumnElement:
+    """
+    Equality / array-membership filter on a top-level JSONB key, emitted as containment:
+        col @> '{"field": value}'      (scalar equality)
+        col @> '{"field": [value]}'    (array_member=True: value is one of the array items)
+
+    Only @> can use a jsonb_path_ops GIN index; `col->>'field' = ...` always scans.
+    Range filters (scores) belong on plain Integer columns with B-tree indexes instead.
+    """
+    return column.contains({field: [value] if array_member else value})
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 from app.core.network_utils import force_ipv4_resolution
 
 # Apply network patch immediately to fix Render/Supabase IPv6 issues
@@ -13,36 +14,91 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+SCHEMA_VERSION_TABLE = "_schema"
+
+
+def _metadata_fingerprint(metadata, dialect) -> str:
+    """
+    Stable hash of the DDL that create_all would emit for the current models.
+    """
+    from sqlalchemy.schema import CreateTable, CreateIndex
+
+    ddl = []
+    for table in metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+def _sync_schema(sync_conn, metadata) -> bool:
+    """
+    Create missing tables only when the model fingerprint changed since the last boot.
+    Runs inside the caller's transaction (Postgres DDL is transactional).
+    Returns True if DDL was applied.
+    """
+    from sqlalchemy import text, inspect
+
+    fingerprint = _metadata_fingerprint(metadata, sync_conn.dialect)
+    sync_conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (id INTEGER PRIMARY KEY, fingerprint VARCHAR(64) NOT NULL)"
+    ))
+    stored = sync_conn.execute(text(f"SELECT fingerprint FROM {SCHEMA_VERSION_TABLE} WHERE id = 1")).scalar()
+    if stored == fingerprint:
+        return False
+
+    # One catalog query instead of a has_table() round trip per model
+    existing = set(inspect(sync_conn).get_table_names())
+    missing = [t for t in metadata.sorted_tables if t.name not in existing]
+    metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+
+    sync_conn.execute(
+        text(
+            f"INSERT INTO {SCHEMA_VERSION_TABLE} (id, fingerprint) VALUES (1, :fp) "
+            "ON CONFLICT (id) DO UPDATE SET fingerprint = EXCLUDED.fingerprint"
+        ),
+        {"fp": fingerprint},
+    )
+    return True
+
+
+async def _init_remote_db():
+    """
+    Initialize Supabase PostgreSQL Tables (if connection string present)
+    """
+    if not settings.DATABASE_URL or "sqlite" in settings.DATABASE_URL:
+        return
+
+    # Import here to avoid circular dependencies or early initialization
+    from app.db.session import engine
+    from app.db.base import Base
+    # Trigger model registration
+    from app.models.beacon import Beacon
+    from app.models.beacon_update import BeaconUpdate
+    from app.models.beacon_message import BeaconMessage
+
+    try:
+        # Add timeout to fail fast if connection hangs (e.g. firewall/network issues)
+        # 10 seconds should be plenty for a healthy connection
+        async with asyncio.timeout(10):
+            async with engine.begin() as conn:
+                schema_changed = await conn.run_sync(_sync_schema, Base.metadata)
+        logger.info("remote_db_init_complete", schema_changed=schema_changed)
+    except TimeoutError:
+        logger.error("remote_db_init_timeout", message="Connection to database timed out after 10s. Check network/firewall/URL settings.")
+        raise
+    except Exception as e:
+        logger.error("remote_db_init_failed", error=str(e))
+        raise
+
+
 async def run_init_db():
     logger.info("db_init_start")
-    
-    # 1. Initialize Local SQLite (always needed for staging)
-    await init_local_db()
-    
-    # 2. Initialize Supabase PostgreSQL Tables (if connection string present)
-    if settings.DATABASE_URL and "sqlite" not in settings.DATABASE_URL:
-        # Import here to avoid circular dependencies or early initialization
-        from app.db.session import engine
-        from app.db.base import Base
-        # Trigger model registration
-        from app.models.beacon import Beacon
-        from app.models.beacon_update import BeaconUpdate
-        from app.models.beacon_message import BeaconMessage
-        
-        try:
-            # Add timeout to fail fast if connection hangs (e.g. firewall/network issues)
-            # 10 seconds should be plenty for a healthy connection
-            async with asyncio.timeout(10):
-                async with engine.begin() as conn:
-                    await conn.run_sync(Base.metadata.create_all)
-            logger.info("remote_db_init_complete")
-        except TimeoutError:
-            logger.error("remote_db_init_timeout", message="Connection to database timed out after 10s. Check network/firewall/URL settings.")
-            raise
-        except Exception as e:
-            logger.error("remote_db_init_failed", error=str(e))
-            raise
-    
+
+    # Local SQLite (always needed for staging) and remote Postgres are independent,
+    # so their connect + DDL round trips overlap instead of running back to back.
+    await asyncio.gather(init_local_db(), _init_remote_db())
+
     logger.info("db_init_complete")
 
 if __name__ == "__main__":
@@ -59,6 +59,86 @@ async def get_local_db() -> AsyncSession:
             await session.close()
 
 
+def _migrate_sender_codes(sync_conn):
+    """
+    One-off rebuild of local_conversations from the old VARCHAR + CHECK 'sender' column
+    to SMALLINT codes. SQLite cannot alter a column type/CHECK in place, so the table
+    is recreated and the rows copied over.
+    """
+    from sqlalchemy import text
+    from app.models.local_models import LocalConversation
+
+    table = LocalConversation.__table__
+    columns = sync_conn.execute(text(f"PRAGMA table_info({table.name})")).fetchall()
+    sender_type = next((c[2] for c in columns if c[1] == "sender"), None)
+    if sender_type is None or sender_type.upper() == "SMALLINT":
+        return  # Fresh DB (create_all builds it) or already migrated
+
+    codes = table.c.sender.type.codes
+    known = ", ".join(f"'{member.name}'" for member in codes)
+    unknown = sync_conn.execute(text(
+        f"SELECT DISTINCT sender FROM {table.name} WHERE sender NOT IN ({known})"
+    )).scalars().all()
+    if unknown:
+        # Abort before touching the table: the CASE below has no code for these values
+        raise RuntimeError(f"Cannot migrate {table.name}.sender: unknown values {unknown}")
+
+    # pysqlite only opens a transaction before DML, so the RENAME/CREATE would autocommit;
+    # an explicit BEGIN keeps rename, copy and drop in one transaction that rolls back on error
+    # (this is the first step of init_local_db, so no transaction is open yet).
+    sync_conn.exec_driver_sql("BEGIN")
+    legacy = f"{table.name}_legacy"
+    sync_conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {legacy}"))
+    # Indexes keep their names after the rename; drop them so the new table can reuse them
+    for (name,) in sync_conn.execute(text(
+        f"SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = '{legacy}' AND sql IS NOT NULL"
+    )).fetchall():
+        sync_conn.execute(text(f'DROP INDEX "{name}"'))
+    table.create(sync_conn)
+
+    case = " ".join(f"WHEN '{member.name}' THEN {code}" for member, code in codes.items())
+    sync_conn.execute(text(
+        f"INSERT INTO {table.name} (id, session_id, sender, content, created_at) "
+        f"SELECT id, session_id, CASE sender {case} END, content, created_at FROM {legacy}"
+    ))
+    sync_conn.execute(text(f"DROP TABLE {legacy}"))
+    print(f"[LOCAL_DB] Migrated {table.name}.sender to SMALLINT codes", flush=True)
+
+
+def _migrate_hex_digests(sync_conn):
+    """
+    access_token_hash moved from hex text to raw 32-byte digests; convert rows written
+    before the change (SQLite keeps both kinds side by side, so check the stored type).
+    """
+    from sqlalchemy import text
+
+    exists = sync_conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'local_sessions'")).first()
+    if not exists:
+        return
+    rows = sync_conn.execute(text(
+        "SELECT id, access_token_hash FROM local_sessions WHERE typeof(access_token_hash) = 'text'"
+    )).fetchall()
+    for row_id, hex_digest in rows:
+        sync_conn.execute(
+            text("UPDATE local_sessions SET access_token_hash = :digest WHERE id = :id"),
+            {"digest": bytes.fromhex(hex_digest), "id": row_id},
+        )
+
+
+# Indexes replaced by newer definitions in local_models (create_all never drops anything)
+OBSOLETE_INDEXES = ("ix_local_sessions_access_token_hash",)
+
+
+def _create_missing_indexes(sync_conn, metadata):
+    from sqlalchemy import text
+
+    for name in OBSOLETE_INDEXES:
+        sync_conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_local_db():
     """
     Initialize local SQLite database tables.
@@ -66,6 +146,11 @@ async def init_local_db():
     from app.models.local_models import LocalBase
     
     async with local_engine.begin() as conn:
+        await conn.run_sync(_migrate_sender_codes)
+        await conn.run_sync(_migrate_hex_digests)
         await conn.run_sync(LocalBase.metadata.create_all)
+        # create_all skips tables that already exist, so add indexes introduced after
+        # the staging DB was first created (CREATE INDEX IF NOT EXISTS semantics)
+        await conn.run_sync(_create_missing_indexes, LocalBase.metadata)
     
     print(f"[LOCAL_DB] Initialized local staging database at {LOCAL_DB_PATH}")
@@ -62,17 +62,94 @@ if "supabase" in db_url or "db." in db_url or "127.0.0.1" not in db_url: # Assum
 
 # If using Supabase Transaction Pooler (port 6543 OR explicit pooler hostname), we must disable prepared statements
 # (Though we are currently on 5432, we keep this logic just in case)
-if ":6543" in db_url or "pooler.supabase.com" in db_url:
+is_pooler = ":6543" in db_url or "pooler.supabase.com" in db_url
+if is_pooler:
     connect_args["statement_cache_size"] = 0
+    connect_args["prepared_statement_cache_size"] = 0  # SQLAlchemy's adapter-level cache too
+else:
+    # Direct connections keep server-side prepared statements: hot lookups (case_id, track,
+    # admin list) skip parse/plan after the first execution on each pooled connection.
+    connect_args["statement_cache_size"] = 1024  # asyncpg cache (default 100)
+    connect_args["prepared_statement_cache_size"] = 1024  # SQLAlchemy asyncpg adapter cache
+
+# TCP keepalives: Render/Supabase NAT silently drops idle connections after a few minutes.
+# Server side: Postgres probes its end of the socket (PgBouncer rejects unknown startup params, so skip for the pooler).
+if not is_pooler:
+    connect_args["server_settings"] = {
+        "tcp_keepalives_idle": "60",
+        "tcp_keepalives_interval": "10",
+        "tcp_keepalives_count": "3",
+    }
+
+# Pooling: PgBouncer (transaction pooler) already pools server connections, so stacking a
+# client pool on top only pins them; open/close per checkout there. For direct connections,
+# reuse warm connections instead of paying TCP + TLS + auth on every request.
+if is_pooler:
+    pool_kwargs = {"poolclass": NullPool}
+else:
+    pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,  # Detect connections dropped while idle before handing them out
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
 
 engine = create_async_engine(
     db_url,
-    echo=settings.ENVIRONMENT == "development",
+    echo=False,  # echo logs every statement + params; see sampled hook below
     future=True,
-    poolclass=NullPool,
     connect_args=connect_args,
+    **pool_kwargs,
 )
 
+# Client side: enable SO_KEEPALIVE on every new asyncpg socket
+from sqlalchemy import event
+
+@event.listens_for(engine.sync_engine, "connect")
+def enable_tcp_keepalive(dbapi_connection, connection_record):
+    try:
+        transport = dbapi_connection.driver_connection._transport
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):  # Linux only
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    except Exception as e:
+        print(f"[NETWORK] Could not enable TCP keepalive: {e}", flush=True)
+
+# Sampled query logging: echo=True formats every statement and its parameters through stdlib
+# logging, which is expensive even in dev. Log a small random sample through structlog instead.
+import random
+import structlog
+
+sql_logger = structlog.get_logger("sql")
+
+if settings.SQL_LOG_SAMPLE_RATE > 0:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def sample_sql_statement(conn, cursor, statement, parameters, context, executemany):
+        if random.random() < settings.SQL_LOG_SAMPLE_RATE:
+            # Statement text only; parameters may contain report content
+            sql_logger.info("sql_sample", statement=statement[:500], executemany=executemany)
+
+# N+1 detection (dev/test): report every lazy relationship load, the access pattern that
+# turns one list query into one SELECT per row. Relationships are lazy="raise" today, so
+# this catches new relationships/models added without an explicit loader strategy.
+# Hooked on the ORM Session class so the local SQLite sessions are covered too.
+if settings.ENVIRONMENT in ("development", "test"):
+    from sqlalchemy.orm import Session as _OrmSession
+
+    @event.listens_for(_OrmSession, "do_orm_execute")
+    def detect_lazy_load(orm_execute_state):
+        parent = orm_execute_state.lazy_loaded_from
+        if parent is None:
+            return
+        detail = f"lazy load from {parent.class_.__name__}; use selectinload()/joinedload()"
+        if settings.ENVIRONMENT == "test":
+            raise RuntimeError(f"N+1 query: {detail}")
+        sql_logger.warning("n_plus_one_suspect", detail=detail)
+
 # Create Session Factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -0,0 +1,41 @@
+import enum
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Stores a Python Enum as a SMALLINT code taken from an explicit member -> code mapping.
+    Fixed 2-byte column/index entries instead of VARCHAR + CHECK (SQLite) or a
+    native enum type that needs ALTER TYPE for every new value (Postgres).
+
+    Stored codes are data: never change or reuse a code, give new members a new one.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], codes: dict, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        missing = [member.name for member in enum_class if member not in codes]
+        if missing:
+            raise ValueError(f"{enum_class.__name__} members without a SMALLINT code: {missing}")
+        if len(set(codes.values())) != len(codes):
+            raise ValueError(f"{enum_class.__name__} SMALLINT codes must be unique")
+        self.enum_class = enum_class
+        self._codes = dict(codes)
+        self._members = {code: member for member, code in codes.items()}
+
+    @property
+    def codes(self) -> dict:
+        """Enum member -> stored code (used by data migrations)."""
+        return dict(self._codes)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
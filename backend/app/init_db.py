@@ -1,5 +1,5 @@
 import asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
 from app.db.session import engine
 from app.db.base import Base
 from app.core import security
@@ -10,29 +10,41 @@ from sqlalchemy import select
 from app.models.report import Report, ReportConversation, ReportStateTracking, Evidence
 from app.models.admin import Admin, AdminRole
 
+SUPERUSER_EMAIL = "admin@beacon.gov"
+
 async def init_models():
     async with engine.begin() as conn:
         # await conn.run_sync(Base.metadata.drop_all) # Dangerous in prod, useful for dev
         await conn.run_sync(Base.metadata.create_all)
-        
+
     print("Database tables created successfully.")
-    
-    # Init Superuser
-    async with AsyncSession(engine) as session:
-        result = await session.execute(select(Admin).where(Admin.email == "admin@beacon.gov"))
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            print("Creating superuser...")
-            user = Admin(
-                email="admin@beacon.gov",
-                password_hash=security.get_password_hash("admin"), # Hardcoded for safety during demo setup? No, use env var instructions usually.
+
+    # Init Superuser (single transaction)
+    # The existence probe is one round trip on every boot after the first; bcrypt (~100ms)
+    # only runs when the row is actually missing. ON CONFLICT keeps the seed idempotent
+    # if two instances boot at the same time.
+    async with engine.begin() as conn:
+        exists = (await conn.execute(select(Admin.id).where(Admin.email == SUPERUSER_EMAIL))).first()
+        if exists:
+            print("Superuser already exists.")
+            return
+
+        print("Creating superuser...")
+        password_hash = await asyncio.to_thread(security.get_password_hash, "admin") # Hardcoded for safety during demo setup? No, use env var instructions usually.
+        stmt = (
+            insert(Admin)
+            .values(
+                email=SUPERUSER_EMAIL,
+                password_hash=password_hash,
                 role=AdminRole.SUPER_ADMIN,
-                is_active=True
+                is_active=True,
             )
-            session.add(user)
-            await session.commit()
-            print("Superuser created: admin@beacon.gov / admin")
+            .on_conflict_do_nothing(index_elements=[Admin.email])
+            .returning(Admin.id)
+        )
+        created = (await conn.execute(stmt)).first()
+        if created:
+            print(f"Superuser created: {SUPERUSER_EMAIL} / admin")
         else:
             print("Superuser already exists.")
 
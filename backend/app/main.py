@@ -1,14 +1,19 @@
+import asyncio
+import importlib.util
 from contextlib import asynccontextmanager
 from app.core.network_utils import force_ipv4_resolution
 
 # Apply network patch immediately
 force_ipv4_resolution()
 
+# uvicorn selects the event loop (--loop uvloop); uvloop is not available on Windows
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 import traceback
@@ -22,20 +27,54 @@ from app.core.exceptions import (
     validation_exception_handler,
 )
 
-# Setup Logging
-setup_logging()
+# structlog.get_logger() returns a lazy proxy; configuration happens in lifespan
 logger = structlog.get_logger()
 
+def load_routers() -> list:
+    """
+    Import the API router modules: (router, prefix, tags) for each mount.
+    Deferred to startup so the heavy model/service/LLM imports don't delay the port bind;
+    only imports, so it can run in a worker thread.
+    """
+    from app.api.v1.public import reporting as public_reporting, evidence as public_evidence, tracking as public_tracking
+    from app.api.v1.admin import auth as admin_auth, reports as admin_reports, evidence as admin_evidence, updates as admin_updates
+    from app.api.v1 import files as admin_files
+
+    return [
+        (public_reporting.router, f"{settings.API_V1_STR}/public/reports", ["reporting"]),
+        (public_tracking.router, f"{settings.API_V1_STR}/public", ["tracking"]), # Mount at /public so it becomes /public/track
+        (public_evidence.router, f"{settings.API_V1_STR}/public/evidence", ["evidence"]),
+        (admin_auth.router, f"{settings.API_V1_STR}/admin/auth", ["admin-auth"]),
+        (admin_reports.router, f"{settings.API_V1_STR}/admin/reports", ["admin-reports"]),
+        (admin_updates.router, f"{settings.API_V1_STR}/admin/reports", ["admin-updates"]), # Mount at /admin/reports for /{id}/update
+        (admin_evidence.router, f"{settings.API_V1_STR}/admin/evidence", ["admin-evidence"]),
+        (admin_files.router, f"{settings.API_V1_STR}/files", ["files"]), # Generic endpoint /api/v1/files
+    ]
+
+def include_routers(app: FastAPI, routers: list):
+    """
+    Mount the imported routers. Mutates the app's routes, so it runs on the loop thread.
+    """
+    for router, prefix, tags in routers:
+        app.include_router(router, prefix=prefix, tags=tags)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifecycle manager for the application.
-    Initializes database (Local + Remote) on startup.
+    Configures logging, mounts routers and initializes database (Local + Remote) on startup.
     """
+    setup_logging()
+
+    from app.db.init_db import run_init_db
+    # DB initialization (includes network patch and connectivity check) runs on the loop while
+    # the router modules are imported in a worker thread; the routers are then mounted here on
+    # the loop thread, and the init task is awaited before the app starts serving.
+    init_task = asyncio.create_task(run_init_db())
+    include_routers(app, await asyncio.to_thread(load_routers))
+
     try:
-        from app.db.init_db import run_init_db
-        # Run DB initialization (includes network patch and connectivity check)
-        await run_init_db()
+        await init_task
         app.state.db_connected = True
     except Exception as e:
         logger.error("startup_failed", error=str(e))
@@ -48,12 +87,18 @@ async def lifespan(app: FastAPI):
     logger.info("startup", project=settings.PROJECT_NAME)
     yield
     logger.info("shutdown")
+    # Close pooled Postgres connections cleanly instead of letting them be dropped at exit
+    from app.db.session import engine
+    await engine.dispose()
+    from app.services.ai_service import GroqService
+    await GroqService.aclose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="5.0.0",
     description="Government-grade Anti-Corruption Reporting System",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=f"{settings.API_V1_STR}/docs",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
 )
@@ -81,31 +126,27 @@ async def health_check(request: Request):
     """
     db_connected = getattr(app.state, "db_connected", False)
     if not db_connected:
-        return JSONResponse(status_code=503, content={"status": "degraded", "environment": settings.ENVIRONMENT, "db": "disconnected"})
+        return ORJSONResponse(status_code=503, content={"status": "degraded", "environment": settings.ENVIRONMENT, "db": "disconnected"})
         
     return {"status": "ok", "environment": settings.ENVIRONMENT, "db": "connected"}
 
 
-from app.api.v1.public import reporting as public_reporting, evidence as public_evidence, tracking as public_tracking
-from app.api.v1.admin import auth as admin_auth, reports as admin_reports, evidence as admin_evidence, updates as admin_updates
-from app.api.v1 import files as admin_files
-
-app.include_router(public_reporting.router, prefix=f"{settings.API_V1_STR}/public/reports", tags=["reporting"])
-app.include_router(public_tracking.router, prefix=f"{settings.API_V1_STR}/public", tags=["tracking"]) # Mount at /public so it becomes /public/track
-app.include_router(public_evidence.router, prefix=f"{settings.API_V1_STR}/public/evidence", tags=["evidence"])
-app.include_router(admin_auth.router, prefix=f"{settings.API_V1_STR}/admin/auth", tags=["admin-auth"])
-app.include_router(admin_reports.router, prefix=f"{settings.API_V1_STR}/admin/reports", tags=["admin-reports"])
-app.include_router(admin_updates.router, prefix=f"{settings.API_V1_STR}/admin/reports", tags=["admin-updates"]) # Mount at /admin/reports for /{id}/update
-app.include_router(admin_evidence.router, prefix=f"{settings.API_V1_STR}/admin/evidence", tags=["admin-evidence"])
-app.include_router(admin_files.router, prefix=f"{settings.API_V1_STR}/files", tags=["files"]) # Generic endpoint /api/v1/files
-
 # Mount Static Files (Uploads)
+# Set SERVE_UPLOADS=false when a reverse proxy/CDN serves /uploads directly.
 UPLOAD_DIR = "uploads"
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
+
+if settings.SERVE_UPLOADS:
+    app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
 # app.include_router(api_router, prefix=settings.API_V1_STR)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if HAS_UVLOOP else "asyncio",
+        http="httptools",
+    )
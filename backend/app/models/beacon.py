@@ -7,17 +7,18 @@ This table stores exactly ONE row per case with:
 - incident_summary: Generated once after full chat
 - credibility_score: Integer 1-100 (permanent)
 - score_explanation: Detailed reasoning for the score
-- evidence_files: JSONB with actual file content (Base64)
+- evidence_files: JSONB references to files in object storage (no file bytes)
 """
 
-import uuid
-from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
 import re
 
 from app.db.base import Base
+from app.core.time_utils import get_utc_now
 
 
 class Beacon(Base):
@@ -26,6 +27,21 @@ class Beacon(Base):
     Exactly ONE row per case - INSERT once, UPDATE for subsequent changes.
     """
     __tablename__ = "beacon"
+    __table_args__ = (
+        # Admin list view: ORDER BY reported_at DESC
+        Index("ix_beacon_reported_at", "reported_at"),
+        # Status-filtered listings sorted by report time
+        Index("ix_beacon_status_reported_at", "analysis_status", "reported_at"),
+        # Pending analysis queue: partial index only holds rows still waiting
+        Index("ix_beacon_pending_reported_at", "reported_at", postgresql_where=text("analysis_status = 'pending'")),
+        # Admin filters on breakdown fields go through containment (app.db.filters.jsonb_eq_filter)
+        Index(
+            "idx_beacon_credibility_breakdown_gin", "credibility_breakdown",
+            postgresql_using="gin", postgresql_ops={"credibility_breakdown": "jsonb_path_ops"},
+        ),
+        # Score range filters use the first-class column, not the JSON copy
+        Index("ix_beacon_credibility_score", "credibility_score"),
+    )
     
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -38,7 +54,7 @@ class Beacon(Base):
     incident_summary = Column(Text, nullable=True)
     credibility_score = Column(Integer, nullable=True)  # 1-100
     score_explanation = Column(Text, nullable=True)     # Added to match DB
-    credibility_breakdown = Column(JSON, nullable=True) # Full 8-dimension breakdown
+    credibility_breakdown = Column(JSONB, nullable=True) # Full 8-dimension breakdown
     authority_summary = Column(Text, nullable=True)     # Internal neutral justification
 
     # Secret Access & Status Tracking (New)
@@ -50,20 +66,25 @@ class Beacon(Base):
     last_raw_status = Column(Text, nullable=True)       # Raw NGO input
     last_framed_status = Column(Text, nullable=True)    # LLM-framed public output
     
-    last_updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    last_updated_at = Column(DateTime(timezone=True), default=get_utc_now, onupdate=get_utc_now, nullable=False)
     
-    # Evidence (Base64 encoded files in JSONB)
-    # Format: [{"file_name": "...", "mime_type": "...", "size_bytes": N, "content_base64": "..."}]
-    evidence_files = Column(JSON, default=list)
+    # Evidence references in JSONB (file bytes live in Supabase Storage, never in this row)
+    # Format: [{"file_name": "...", "mime_type": "...", "size_bytes": N, "sha256": "...", "bucket": "...", "path": "...", "full_url": "..."}]
+    evidence_files = Column(JSONB, default=list)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=get_utc_now, onupdate=get_utc_now, nullable=False)
 
     # Two-Phase Analysis Tracking
     analysis_status = Column(String, default="pending", nullable=False) # 'pending' or 'completed'
     analysis_attempts = Column(Integer, default=0, nullable=False)
     analysis_last_error = Column(Text, nullable=True) # Internal debugging only
+
+    # Case timelines (joined on case_id FK). Read-only and lazy="raise": rows are written via
+    # their own INSERTs, and every read must opt in with selectinload/joinedload (no N+1).
+    updates = relationship("BeaconUpdate", order_by="BeaconUpdate.created_at", viewonly=True, lazy="raise")
+    messages = relationship("BeaconMessage", order_by="BeaconMessage.created_at", viewonly=True, lazy="raise")
     
     @staticmethod
     def validate_case_id(case_id: str) -> bool:
@@ -81,3 +102,8 @@ class Beacon(Base):
         Validate credibility score is between 1 and 100.
         """
         return 1 <= score <= 100
+
+
+# Register relationship targets with the mapper whenever Beacon is imported
+from app.models.beacon_update import BeaconUpdate  # noqa: E402
+from app.models.beacon_message import BeaconMessage  # noqa: E402
@@ -3,16 +3,18 @@ Beacon Message Model - Stores two-way communication for a case.
 """
 
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.db.base import Base
+from app.core.time_utils import get_utc_now
 
 class BeaconMessage(Base):
     """
     Stores messages exchanged between User vs NGO.
     """
     __tablename__ = "beacon_message"
+    # Timeline query: WHERE case_id = ? ORDER BY created_at
+    __table_args__ = (Index("ix_beacon_message_case_created", "case_id", "created_at"),)
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     case_id = Column(String, ForeignKey("beacon.case_id"), nullable=False, index=True)
@@ -21,6 +23,6 @@ class BeaconMessage(Base):
     content = Column(Text, nullable=True)        # Text content
     
     # Attachments: List of {file_name, file_path, file_hash, mime_type}
-    attachments = Column(JSON, default=list)
+    attachments = Column(JSONB, default=list)
     
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
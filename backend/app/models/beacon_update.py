@@ -3,16 +3,18 @@ Beacon Update Model - Stores updates for a case.
 """
 
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.base import Base
+from app.core.time_utils import get_utc_now
 
 class BeaconUpdate(Base):
     """
     Stores status updates for a beacon case.
     """
     __tablename__ = "beacon_update"
+    # Timeline query: WHERE case_id = ? ORDER BY created_at
+    __table_args__ = (Index("ix_beacon_update_case_created", "case_id", "created_at"),)
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     case_id = Column(String, ForeignKey("beacon.case_id"), nullable=False, index=True)
@@ -21,4 +23,4 @@ class BeaconUpdate(Base):
     public_update = Column(Text, nullable=False) # LLM-rewritten text for public
     updated_by = Column(String, nullable=True)   # NGO User ID or Name
     
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
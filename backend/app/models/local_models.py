@@ -6,35 +6,51 @@ Only data needed by authorities is transferred to Supabase beacon table.
 """
 
 import uuid
-from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, JSON, Enum
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, JSON, Index, LargeBinary, text
 from sqlalchemy.orm import declarative_base
 import enum
 
+from app.core.time_utils import get_utc_now
+from app.db.types import SmallIntEnum
+
 # Separate Base for local models
 LocalBase = declarative_base()
 
+# NOTE: Timestamps stay Python-side here. SQLite's CURRENT_TIMESTAMP has one-second
+# resolution, which would break created_at ordering of chat messages within a turn.
+
 
+# Stored as SMALLINT codes (SmallIntEnum): give new members a new code, never change or reuse one
 class LocalSenderType(str, enum.Enum):
     USER = 'USER'
     AI = 'AI'
     SYSTEM = 'SYSTEM'
 
+LOCAL_SENDER_CODES = {
+    LocalSenderType.USER: 0,
+    LocalSenderType.AI: 1,
+    LocalSenderType.SYSTEM: 2,
+}
+
 
 class LocalSession(LocalBase):
     """
     Active chat session stored locally.
     """
     __tablename__ = "local_sessions"
+    # Tokens only matter while the session is active: a partial index stays small and hot
+    __table_args__ = (
+        Index("ix_local_sessions_token_active", "access_token_hash", unique=True, sqlite_where=text("is_active = 1")),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    access_token_hash = Column(String(255), unique=True, nullable=False, index=True)
+    access_token_hash = Column(LargeBinary(32), nullable=False)  # Raw SHA-256 digest
     is_active = Column(Boolean, default=True, nullable=False)
     is_submitted = Column(Boolean, default=False, nullable=False)
     case_id = Column(String(15), nullable=True)  # Set when submitted
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=get_utc_now, onupdate=get_utc_now, nullable=False)
 
 
 class LocalConversation(LocalBase):
@@ -42,12 +58,14 @@ class LocalConversation(LocalBase):
     Chat messages stored locally during active session.
     """
     __tablename__ = "local_conversations"
+    # Chat history is always "one session, oldest first": index-order scan, no sort step
+    __table_args__ = (Index("ix_local_conversations_session_created", "session_id", "created_at"),)
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     session_id = Column(String(36), nullable=False, index=True)
-    sender = Column(Enum(LocalSenderType), nullable=False)
+    sender = Column(SmallIntEnum(LocalSenderType, LOCAL_SENDER_CODES), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
 
 
 class LocalStateTracking(LocalBase):
@@ -59,7 +77,7 @@ class LocalStateTracking(LocalBase):
     session_id = Column(String(36), primary_key=True)
     current_step = Column(String(50), nullable=False)
     context_data = Column(JSON, default=dict, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=get_utc_now, onupdate=get_utc_now, nullable=False)
 
 
 class LocalEvidence(LocalBase):
@@ -76,4 +94,4 @@ class LocalEvidence(LocalBase):
     size_bytes = Column(Integer, nullable=False)
     file_hash = Column(String(128), nullable=False)
     is_pii_cleansed = Column(Boolean, default=False, nullable=False)
-    uploaded_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    uploaded_at = Column(DateTime(timezone=True), default=get_utc_now, nullable=False)
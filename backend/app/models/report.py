@@ -1,13 +1,16 @@
-import uuid
-from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, Enum, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID # UUID is fine usually as string in SQLite or dedicated type if using aiosqlite? SQLAlchemy handles it. But JSONB is PG specific.
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, Text, Index, LargeBinary, text, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB # These tables live in Postgres only (local staging uses local_models)
 from sqlalchemy.orm import relationship
 import enum
 
 from app.db.base import Base
+from app.db.types import SmallIntEnum
+from app.core.ids import uuid7  # time-ordered ids keep PK index inserts sequential
+from app.core.time_utils import get_utc_now
 
+# The enums below are stored as SMALLINT codes (SmallIntEnum) from the *_CODES maps:
+# give new members a new code, never change or reuse an existing one
 class ReportStatus(str, enum.Enum):
     NEW = 'NEW'
     ANALYZING = 'ANALYZING'
@@ -17,69 +20,114 @@ class ReportStatus(str, enum.Enum):
     CLOSED = 'CLOSED'
     DISMISSED = 'DISMISSED'
 
+REPORT_STATUS_CODES = {
+    ReportStatus.NEW: 0,
+    ReportStatus.ANALYZING: 1,
+    ReportStatus.VERIFIED: 2,
+    ReportStatus.IN_REVIEW: 3,
+    ReportStatus.ESCALATED: 4,
+    ReportStatus.CLOSED: 5,
+    ReportStatus.DISMISSED: 6,
+}
+
 class ReportPriority(str, enum.Enum):
     LOW = 'LOW'
     MEDIUM = 'MEDIUM'
     HIGH = 'HIGH'
     CRITICAL = 'CRITICAL'
 
+REPORT_PRIORITY_CODES = {
+    ReportPriority.LOW: 0,
+    ReportPriority.MEDIUM: 1,
+    ReportPriority.HIGH: 2,
+    ReportPriority.CRITICAL: 3,
+}
+
 class SenderType(str, enum.Enum):
     USER = 'USER'
     AI = 'AI'
     SYSTEM = 'SYSTEM'
 
+SENDER_TYPE_CODES = {
+    SenderType.USER: 0,
+    SenderType.AI: 1,
+    SenderType.SYSTEM: 2,
+}
+
+# Timestamps are set in Python: Postgres now() is the transaction start time, so rows written in
+# one transaction would tie on created_at. server_default only covers inserts outside the ORM.
+
+def _gin_index(table: str, column: str) -> Index:
+    # jsonb_path_ops: smaller/faster GIN that only serves containment (@>), i.e. Column.contains()
+    return Index(f"idx_{table}_{column}_gin", column, postgresql_using="gin", postgresql_ops={column: "jsonb_path_ops"})
+
 class Report(Base):
     __tablename__ = "reports"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Filter on these with Report.categories.contains([...]) so the GIN index is used
+    __table_args__ = (
+        _gin_index("reports", "categories"),
+        _gin_index("reports", "credibility_breakdown"),
+        _gin_index("reports", "evidence_analysis"),
+        _gin_index("reports", "location_meta"),
+        # Token lookups only happen for open reports; closed/dismissed ones drop out of the index
+        Index(
+            "ix_reports_token_open", "access_token_hash", unique=True,
+            postgresql_where=text(f"status NOT IN ({REPORT_STATUS_CODES[ReportStatus.CLOSED]}, {REPORT_STATUS_CODES[ReportStatus.DISMISSED]})"),
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     case_id = Column(String(15), unique=True, nullable=True, index=True)  # Format: BCN + 12 chars
-    access_token_hash = Column(String(255), unique=True, nullable=False, index=True)
+    access_token_hash = Column(LargeBinary(32), nullable=False)  # Raw SHA-256 digest; unique among open reports (partial index below)
     
-    status = Column(Enum(ReportStatus), default=ReportStatus.NEW, nullable=False, index=True)
-    priority = Column(Enum(ReportPriority), default=ReportPriority.LOW, nullable=False, index=True)
+    status = Column(SmallIntEnum(ReportStatus, REPORT_STATUS_CODES), default=ReportStatus.NEW, nullable=False, index=True)
+    priority = Column(SmallIntEnum(ReportPriority, REPORT_PRIORITY_CODES), default=ReportPriority.LOW, nullable=False, index=True)
     credibility_score = Column(Integer, nullable=True)
-    credibility_breakdown = Column(JSON, nullable=True) # Full 8-dimension breakdown
+    credibility_breakdown = Column(JSONB, nullable=True) # Full 8-dimension breakdown
     authority_summary = Column(Text, nullable=True)
     
-    categories = Column(JSON, default=list)
-    location_meta = Column(JSON, nullable=True)
+    categories = Column(JSONB, default=list)
+    location_meta = Column(JSONB, nullable=True)
     
     # New Credibility Analysis Fields
     incident_summary = Column(Text, nullable=True)
-    evidence_analysis = Column(JSON, nullable=True)
-    tone_analysis = Column(JSON, nullable=True)
+    evidence_analysis = Column(JSONB, nullable=True)
+    tone_analysis = Column(JSONB, nullable=True)
     consistency_score = Column(Integer, nullable=True)
     fabrication_risk_score = Column(Integer, nullable=True)
     
     is_archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=get_utc_now, server_default=func.now(), onupdate=get_utc_now, nullable=False)
 
-    conversations = relationship("ReportConversation", back_populates="report", cascade="all, delete-orphan")
-    state_tracking = relationship("ReportStateTracking", back_populates="report", uselist=False, cascade="all, delete-orphan")
-    evidence = relationship("Evidence", back_populates="report", cascade="all, delete-orphan")
+    # lazy="raise": load with selectinload() (collections) / joinedload() (state_tracking) instead of one SELECT per report
+    conversations = relationship("ReportConversation", back_populates="report", cascade="all, delete-orphan", lazy="raise", order_by="ReportConversation.created_at")
+    state_tracking = relationship("ReportStateTracking", back_populates="report", uselist=False, cascade="all, delete-orphan", lazy="raise")
+    evidence = relationship("Evidence", back_populates="report", cascade="all, delete-orphan", lazy="raise")
 
 class ReportConversation(Base):
     __tablename__ = "report_conversations"
+    __table_args__ = (Index("ix_report_conversations_report_created", "report_id", "created_at"),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     report_id = Column(UUID(as_uuid=True), ForeignKey("reports.id"), nullable=False)
-    sender = Column(Enum(SenderType), nullable=False)
+    sender = Column(SmallIntEnum(SenderType, SENDER_TYPE_CODES), nullable=False)
     
     content_redacted = Column(Text, nullable=False)
     intent_detected = Column(String(100), nullable=True)
     
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=get_utc_now, server_default=func.now(), nullable=False)
 
     report = relationship("Report", back_populates="conversations")
 
 class ReportStateTracking(Base):
     __tablename__ = "report_state_tracking"
+    __table_args__ = (_gin_index("report_state_tracking", "context_data"),)
 
     report_id = Column(UUID(as_uuid=True), ForeignKey("reports.id"), primary_key=True)
     current_step = Column(String(50), nullable=False)
-    context_data = Column(JSON, default=dict, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    context_data = Column(JSONB, default=dict, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=get_utc_now, server_default=func.now(), onupdate=get_utc_now, nullable=False)
 
 
     report = relationship("Report", back_populates="state_tracking")
@@ -87,18 +135,18 @@ class ReportStateTracking(Base):
 class Evidence(Base):
     __tablename__ = "evidence"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     report_id = Column(UUID(as_uuid=True), ForeignKey("reports.id"), nullable=False)
     
     file_path = Column(String(512), nullable=False)
     file_name = Column(String(255), nullable=False)
     mime_type = Column(String(100), nullable=False)
     size_bytes = Column(Integer, nullable=False)
-    file_hash = Column(String(128), nullable=False)
+    file_hash = Column(LargeBinary(32), nullable=False)  # Raw SHA-256 digest (.hex() for display)
     
     is_scanned = Column(Boolean, default=False, nullable=False)
     is_pii_cleansed = Column(Boolean, default=True, nullable=False)
     
-    uploaded_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    uploaded_at = Column(DateTime(timezone=True), default=get_utc_now, server_default=func.now(), nullable=False)
 
     report = relationship("Report", back_populates="evidence")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -97,6 +97,14 @@ class ScoringResult(BaseModel):
     limitations: str = Field(..., description="What could not be verified")
     final_safety_statement: str = Field(..., description="Mandatory disclaimer")
 
+    @field_validator("credibility_score", mode="before")
+    @classmethod
+    def clamp_credibility_score(cls, v: Any) -> Any:
+        # Stored scores are 1-100: clamp out-of-range model output instead of rejecting it
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            return 1 if v < 1 else 100 if v > 100 else v
+        return v
+
 class AIAnalysisResult(BaseModel):
     summary: str
     entities: List[str]
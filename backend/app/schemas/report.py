@@ -1,9 +1,26 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, BeforeValidator
+from typing import Optional, List, Dict, Any, Annotated
 from uuid import UUID
 from datetime import datetime, timezone
 from app.models.report import ReportStatus, SenderType
 
+
+def _to_utc_z(v: Any) -> Any:
+    """
+    Render datetimes as UTC 'YYYY-MM-DDTHH:MM:SSZ' (naive values are treated as UTC).
+    Anything else passes through unchanged.
+    """
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        v = v.astimezone(timezone.utc)
+        # Manual formatting: noticeably cheaper than strftime on list-heavy responses
+        return f"{v.year:04d}-{v.month:02d}-{v.day:02d}T{v.hour:02d}:{v.minute:02d}:{v.second:02d}Z"
+    return v
+
+# Shared timestamp field type for API responses
+UtcZ = Annotated[Any, BeforeValidator(_to_utc_z)]
+
 class CreateReportRequest(BaseModel):
     """Initial request to start a report session"""
     client_seed: str = Field(..., description="Random seed from client for encryption/token generation uniqueness")
@@ -22,32 +39,18 @@ class MessageResponse(BaseModel):
     report_id: UUID
     sender: SenderType
     content: str
-    timestamp: Any
+    timestamp: UtcZ
     next_step: Optional[str] = None
     case_id: Optional[str] = None  # BCN + 12 digits, present when submitted
     secret_key: Optional[str] = None # Present ONLY once on submission
 
-    @validator("timestamp", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
-
 class TrackStatusRequest(BaseModel):
     case_id: str
     secret_key: str
 
 class PublicUpdate(BaseModel):
     message: str
-    timestamp: Any
-
-    @validator("timestamp", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
+    timestamp: UtcZ
 
 class MessageAttachment(BaseModel):
     file_name: str
@@ -59,30 +62,16 @@ class TrackMessage(BaseModel):
     sender_role: str
     content: Optional[str] = None
     attachments: List[MessageAttachment] = []
-    timestamp: Any
-
-    @validator("timestamp", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
+    timestamp: UtcZ
 
 class TrackStatusResponse(BaseModel):
     status: str
-    reported_at: Any
+    reported_at: UtcZ
     incident_summary: Optional[str] = None
-    last_updated: Any
+    last_updated: UtcZ
     updates: List[PublicUpdate] = []
     messages: List[TrackMessage] = []
 
-    @validator("reported_at", "last_updated", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
-
 class TrackMessageRequest(BaseModel):
     case_id: str
     secret_key: str
@@ -102,12 +91,5 @@ class NGOUpdateRequest(BaseModel):
 class NGOUpdateResponse(BaseModel):
     status: str
     public_update: str
-    timestamp: Any
-
-    @validator("timestamp", pre=True)
-    def ensure_utc(cls, v):
-        if isinstance(v, datetime):
-            if v.tzinfo is None: v = v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return v
+    timestamp: UtcZ
 
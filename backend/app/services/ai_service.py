@@ -1,15 +1,330 @@
+import asyncio
 import httpx
-import json
+import re
+import functools
+import orjson
+import random
 import structlog
-from typing import Optional, Dict, Any, Type, TypeVar, List
-from pydantic import BaseModel
+import types
+from enum import Enum
+from typing import Optional, Dict, Any, Type, TypeVar, List, AsyncIterator, Final, Union, Tuple, Mapping, get_args, get_origin
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
 from app.core.config import settings
-from app.schemas.ai import AIAnalysisResult, EvidenceMetadata, ScoringResult
-import base64
+from app.services.response_cache import LLMResponseCache
+from app.schemas.ai import AIAnalysisResult, EvidenceMetadata, ScoringResult, ForensicOCRAnalysis, ForensicAudioAnalysis
+import hashlib
+import threading
+from collections import OrderedDict
+
+# SIMD base64 encoder where installed; stdlib otherwise
+try:
+    import pybase64
+    _b64encode = pybase64.b64encode_as_string
+except ImportError:
+    import base64
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
 
 logger = structlog.get_logger()
 T = TypeVar("T", bound=BaseModel)
 
+# Optional ```json ... ``` wrapper around model output (single pass, no repeated str.replace)
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def _describe_type(annotation: Any) -> str:
+    """
+    Compact type notation: str, int, [str], {key:type,...}, a|b for enums, ? suffix for Optional.
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        described = "|".join(_describe_type(a) for a in args)
+        return f"{described}?" if len(args) < len(get_args(annotation)) else described
+    if origin in (list, set, tuple):
+        args = get_args(annotation)
+        return f"[{_describe_type(args[0]) if args else 'any'}]"
+    if origin is dict:
+        return "{}"
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _describe_model(annotation)
+        if issubclass(annotation, Enum):
+            return "|".join(str(m.value) for m in annotation)
+    return getattr(annotation, "__name__", "any")
+
+
+def _describe_field(field: FieldInfo) -> str:
+    described = _describe_type(field.annotation)
+    bounds = {k: getattr(m, k) for m in field.metadata for k in ("ge", "le") if getattr(m, k, None) is not None}
+    if bounds:
+        return f"{described}({bounds.get('ge', '')}-{bounds.get('le', '')})"
+    if field.description:
+        return f"{described}({field.description.replace(' | ', '|').replace(' / ', '|')})"
+    return described
+
+
+def _describe_model(schema_class: Type[BaseModel]) -> str:
+    return "{" + ",".join(f"{name}:{_describe_field(f)}" for name, f in schema_class.model_fields.items()) + "}"
+
+
+@functools.lru_cache(maxsize=None)  # One entry per response model class
+def _schema_message(schema_class: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Complete JSON-mode system message for a response model. Uses a one-line field
+    descriptor instead of the full JSON Schema dump (same constraints, a fraction of
+    the input tokens); built once per class. Shared object: never mutate.
+    """
+    return {"role": "system", "content": f"Return JSON only: {_describe_model(schema_class)}"}
+
+
+@functools.lru_cache(maxsize=None)  # One entry per response model class
+def _json_schema_format(schema_class: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    response_format for Groq structured outputs. Not "strict": pydantic fields with
+    defaults are optional, which strict mode rejects; the reply is validated anyway.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": schema_class.__name__, "schema": schema_class.model_json_schema()},
+    }
+
+
+# Field types model_construct can take straight from JSON without coercion
+_PLAIN_JSON_TYPES = (str, int, float, bool, List[str])
+
+
+@functools.lru_cache(maxsize=None)  # One entry per response model class
+def _trusted_fields(schema_class: Type[BaseModel]) -> Optional[frozenset]:
+    """
+    Required field names if every field of schema_class is a plain JSON type without
+    constraints, so parsed output can skip validation via model_construct. None for
+    schemas with nested models or bounds (those always go through model_validate).
+    """
+    fields = schema_class.model_fields
+    if any(f.annotation not in _PLAIN_JSON_TYPES or f.metadata for f in fields.values()):
+        return None
+    return frozenset(name for name, f in fields.items() if f.is_required())
+
+
+@functools.lru_cache(maxsize=None)  # One entry per response model class
+def _adapter(schema_class: Type[T]) -> TypeAdapter:
+    return TypeAdapter(schema_class)
+
+
+def _parse_model(schema_class: Type[T], raw: str) -> T:
+    """
+    Nested/constrained schemas are validated straight from the JSON text by pydantic-core
+    (no intermediate Python dict; ~25% faster than orjson.loads + model_validate here).
+    Flat trusted schemas are decoded with orjson and built with model_construct.
+    """
+    required = _trusted_fields(schema_class)
+    if required is None:
+        return _adapter(schema_class).validate_json(raw)
+    data = orjson.loads(raw)
+    if isinstance(data, dict) and required.issubset(data):
+        return schema_class.model_construct(**data)
+    return schema_class.model_validate(data)
+
+
+# Prompt budget for chat transcripts (~4 chars per token; no tokenizer dependency)
+HISTORY_CHAR_BUDGET = 24000    # ~6k tokens
+HISTORY_MESSAGE_CHAR_CAP = 2000
+HISTORY_HEAD_MESSAGES = 4      # Opening turns carry the core incident facts: always kept
+
+
+def _budget_history(chat_history: List[Dict[str, str]], max_chars: int = HISTORY_CHAR_BUDGET) -> List[Dict[str, str]]:
+    """
+    Cap each message at HISTORY_MESSAGE_CHAR_CAP and, if the transcript is still over
+    max_chars, keep the opening turns plus as many of the latest turns as fit, with a
+    marker for the omitted middle. Returns chat_history itself when nothing is cut.
+    """
+    cap = HISTORY_MESSAGE_CHAR_CAP
+    if any(len(m["content"]) > cap for m in chat_history):
+        chat_history = [m if len(m["content"]) <= cap else {**m, "content": m["content"][:cap] + " [...]"} for m in chat_history]
+    if sum(len(m["content"]) for m in chat_history) <= max_chars:
+        return chat_history
+
+    head = chat_history[:HISTORY_HEAD_MESSAGES]
+    remaining = max_chars - sum(len(m["content"]) for m in head)
+    tail_start = len(chat_history)
+    while tail_start > len(head) and len(chat_history[tail_start - 1]["content"]) <= remaining:
+        tail_start -= 1
+        remaining -= len(chat_history[tail_start]["content"])
+    omitted = tail_start - len(head)
+    marker = {"role": "system", "content": f"[{omitted} messages omitted]"}
+    return [*head, marker, *chat_history[tail_start:]]
+
+
+def _format_history(chat_history: List[Dict[str, str]]) -> str:
+    """
+    "ROLE: content" transcript, one message per line, shared by the summary and scoring prompts
+    and trimmed to the prompt budget. A single join over one f-string per message; building
+    through bytearray or a role-label lookup table measured slower on CPython 3.11.
+    """
+    return "\n".join([f"{msg['role'].upper()}: {msg['content']}" for msg in _budget_history(chat_history)])
+
+
+
+def _digest_entry(ev: EvidenceMetadata) -> str:
+    """
+    One evidence item of the scoring prompt's Layer 1 digest, built as a single string.
+    """
+    status = "CORRUPT/EMPTY" if ev.is_empty_or_corrupt else "DUPLICATE" if ev.is_duplicate else "VALID"
+    audio = f"\n  Audio Transcript: {ev.audio_transcript_snippet}" if ev.audio_transcript_snippet else ""
+    return (
+        f"- File: {ev.file_name} ({ev.file_type}) [{status}]\n"
+        f"  OCR Text: {ev.ocr_text_snippet or '[NO TEXT DETECTED]'}\n"
+        f"  Visual Signals: {', '.join(ev.object_labels) if ev.object_labels else '[OFFICE/CURRENCY SIGNALS NOT FOUND]'}"
+        f"{audio}"
+    )
+
+
+# Longest side sent to the vision model: a multiple of its 336px tiles. Phone photos
+# (12 MP, 4-8 MB) shrink ~10x in bytes and base64 work with no loss of scene detail.
+VISION_MAX_SIDE = 1120
+
+
+def _downscale_image(image_bytes: bytes, mime_type: str) -> tuple:
+    """
+    (bytes, mime) resized to VISION_MAX_SIDE and re-encoded as JPEG q85 with OpenCV
+    (already used by the evidence processor). Returns the input unchanged if it can't
+    be decoded or re-encoding would not make it smaller. CPU-bound: call off the loop.
+    """
+    try:
+        import cv2
+        import numpy as np
+        img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if img is None:
+            return image_bytes, mime_type
+        height, width = img.shape[:2]
+        scale = VISION_MAX_SIDE / max(height, width)
+        if scale < 1:
+            img = cv2.resize(img, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
+        ok, encoded = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if ok and encoded.nbytes < len(image_bytes):
+            return encoded.tobytes(), "image/jpeg"
+    except Exception as e:
+        logger.warning("image_downscale_failed", error=str(e))
+    return image_bytes, mime_type
+
+
+# Recently prepared evidence images (blake2b digest of the original bytes, mime) -> data
+# URL. Retries and repeated analyses of the same file skip both the resize and the encode.
+# Filled from worker threads, hence the lock.
+_DATA_URL_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_DATA_URL_CACHE_SIZE = 16
+_DATA_URL_LOCK = threading.Lock()
+
+
+def _image_data_url(file_bytes: bytes, mime_type: str) -> str:
+    """
+    Downscaled, base64-encoded data URL for an evidence image. Hashing, resizing and
+    encoding are all CPU-bound on multi-megabyte buffers: call via asyncio.to_thread.
+    """
+    key = (hashlib.blake2b(file_bytes, digest_size=16).digest(), mime_type)
+    with _DATA_URL_LOCK:
+        url = _DATA_URL_CACHE.get(key)
+        if url is not None:
+            _DATA_URL_CACHE.move_to_end(key)
+            return url
+    image_bytes, image_mime = _downscale_image(file_bytes, mime_type)
+    url = f"data:{image_mime};base64,{_b64encode(image_bytes)}"
+    with _DATA_URL_LOCK:
+        _DATA_URL_CACHE[key] = url
+        if len(_DATA_URL_CACHE) > _DATA_URL_CACHE_SIZE:
+            _DATA_URL_CACHE.popitem(last=False)
+    return url
+
+
+_OCR_SYSTEM_PROMPT: Final[str] = """Role: forensic OCR text analyzer, Beacon Credibility Engine.
+Input = text already extracted by Tesseract. Do not perform OCR; analyze the text only.
+Task: rate OCR quality/usefulness, find objective verifiable signals, check relevance to user narrative. No assumptions, interpretations or legal conclusions.
+Rules:
+- missing text != absence of evidence
+- never infer intent, illegality or wrongdoing
+- don't fix OCR errors except obvious formatting
+- noisy/low-quality OCR = neutral, not negative
+Signals:
+- text presence: meaningful text vs noise
+- factual elements: dates, monetary amounts, names (people/orgs), locations, official markers (letterheads, stamps, IDs, reference numbers)
+- narrative alignment: elements matching user's claimed facts (partial/indirect counts)
+- limitations: missing/unclear/unreadable parts, OCR ambiguity, no speculation
+Analysis covers OCR text characteristics only; does not verify authenticity, truth or legality."""
+
+_AUDIO_SYSTEM_PROMPT: Final[str] = """Role: forensic audio/video transcription analyzer, Beacon Credibility Engine.
+Input = transcript (FFmpeg preprocessing + external speech-to-text) and metadata. Do not process media; analyze the transcript objectively.
+Rules:
+- never assume speaker intent, identity or role
+- never infer illegality, corruption or wrongdoing
+- don't clean up speech beyond basic readability
+- unclear/partial transcription = neutral
+- no relevant speech != evidence of falsehood
+Signals:
+- usability: meaningful speech vs noise; intelligible enough to extract facts?
+- factual elements (presence only, no interpretation): dates/time refs, monetary amounts, names (people/orgs), locations, references to documents, payments or official actions
+- narrative alignment: spoken elements matching user's claimed facts (partial/indirect/contextual counts)
+- limitations: overlapping speakers, poor audio, missing segments, language uncertainty
+Analysis covers transcription characteristics only; does not verify speaker identity, authenticity, intent, legality or truth."""
+
+_ANALYZE_PROMPT: Final[str] = "Analyze this report. Extract entities, language, and corruption type.\n\nReport: "
+
+_TRANSLATE_PROMPT: Final[str] = "Translate to English (return original if already English): "
+
+# Constant system messages, shared across calls (never mutated: _call_groq copies the list)
+_OCR_SYSTEM_MESSAGE: Final[Dict[str, str]] = {"role": "system", "content": _OCR_SYSTEM_PROMPT}
+_AUDIO_SYSTEM_MESSAGE: Final[Dict[str, str]] = {"role": "system", "content": _AUDIO_SYSTEM_PROMPT}
+
+_VISUAL_PROMPT: Final[str] = (
+    "Describe the scene in ONE short neutral sentence: actors (uniformed personnel, civilian, clerk, shopkeeper), "
+    "environment (road, office, shop, indoors), key objects (documents, money, vehicle). "
+    "E.g. 'Uniformed officer standing on a road next to a vehicle.'"
+)
+
+_EVIDENCE_PROMPT: Final[str] = "Analyze this image. Describe visible text and objects."
+
+# Constant text parts of the vision messages; only the image part changes per call
+_VISUAL_TEXT_PART: Final[Dict[str, str]] = {"type": "text", "text": _VISUAL_PROMPT}
+_EVIDENCE_TEXT_PART: Final[Dict[str, str]] = {"type": "text", "text": _EVIDENCE_PROMPT}
+
+_SUMMARY_INSTRUCTION: Final[str] = (
+    "Professional intelligence summary of this report. Keep dates, names, amounts. Anonymize reporter. "
+    "Facts only. No title/header/prefix (e.g. 'Intelligence Summary:'); start with the content."
+)
+
+_SCORING_SYSTEM_PROMPT: Final[str] = """You are Beacon Credibility Engine: forensic consistency analyst assessing whether evidence meaningfully supports a corruption claim.
+
+PRINCIPLES:
+1. Credibility != truth. Assess coherence, not guilt.
+2. Evidence validates narrative. Unrelated evidence (e.g. ashtray photo for a bribe claim) = STRONG NEGATIVE SIGNAL.
+3. Be skeptical of polished stories with unrelated attachments.
+
+RUBRIC (strict):
+
+1. NARRATIVE CREDIBILITY (0-40)
+   - Evaluates: internal consistency, specific details (dates, names, amounts), logical flow.
+   - Penalize: contradictions, vagueness, emotional instead of factual language.
+
+2. EVIDENCE STRENGTH (0-40)
+   - Evaluates: relevance/alignment between Evidence Digest and Narrative.
+   - RELEVANCE: do visual signals or OCR directly correlate with the narrative?
+   - ACTOR/ENVIRONMENT MATCH: narrative names a specific actor (e.g. Shopkeeper) but Visual Context shows a different one (e.g. Police Officer) = CRITICAL MISMATCH, score 0-10.
+   - REWARD: narrative mentions "cash"/"money" AND Visual Signals show "possible_currency_colors" -> 25-35.
+   - REWARD: narrative mentions a location/office AND Visual Signals show "possible_document_layout" -> 20-30.
+   - VISUAL WEIGHT: do NOT penalize missing OCR text if the Visual Description strongly matches the scene (e.g. corruption event in progress). Text is secondary for photos.
+   - CRITICAL PENALTY: evidence entirely unrelated (e.g. ashtray) or role mismatch as above.
+   - CONSTRAINT: Evidence Digest shows "[NO TEXT DETECTED]" for a document claim and no visual signals match -> < 10.
+
+3. BEHAVIORAL RELIABILITY (0-20)
+   - Evaluates: stability, cooperation, natural timing.
+   - Penalize: evasiveness, robotic repetition.
+
+TOTAL = sum(subscores), max 100."""
+
+_SCORING_SYSTEM_MESSAGE: Final[Dict[str, str]] = {"role": "system", "content": _SCORING_SYSTEM_PROMPT}
+
+
 class GroqService:
     """
     Service for interacting with Groq Cloud API (Llama 3 models).
@@ -18,161 +333,310 @@ class GroqService:
     
     BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
     TIMEOUT = 10.0 # Reduced from 60.0 for fail-fast
+    CONNECT_TIMEOUT = 5.0
     
     # Updated Models (Jan 2026)
     # Downgraded for speed and rate-limit resilience
     TEXT_MODEL = "llama-3.1-8b-instant"
     VISION_MODEL = "llama-3.2-11b-vision"
+    # Per-task tiers: translation/extraction always stay on the small model; summary,
+    # forensics and scoring can be moved to a larger one via GROQ_REASONING_MODEL
+    FAST_MODEL = settings.GROQ_FAST_MODEL
+    REASONING_MODEL = settings.GROQ_REASONING_MODEL
+
+    # Retries for transient failures (429 / 5xx / connection errors), see _post_completion
+    MAX_ATTEMPTS = 4
+    CONNECT_RETRIES = 2
+    RETRY_BASE_DELAY = 0.5  # seconds, doubled per attempt (with jitter)
+    MAX_RETRY_WAIT = 10.0   # give up instead of sleeping longer than this
+
+    # Models that accept response_format "json_schema" (Groq structured outputs). The
+    # llama-3.x models do not, so they keep JSON mode + the descriptor prompt.
+    JSON_SCHEMA_MODELS = frozenset({
+        "openai/gpt-oss-20b",
+        "openai/gpt-oss-120b",
+        "moonshotai/kimi-k2-instruct",
+        "meta-llama/llama-4-maverick-17b-128e-instruct",
+        "meta-llama/llama-4-scout-17b-16e-instruct",
+    })
+
+    # Output budget per call. Output tokens dominate latency, and a tight cap stops the
+    # model rambling past the closing brace; JSON budgets leave room for the reasoning lists.
+    DEFAULT_MAX_TOKENS = 1024   # Short free-text tasks
+    SUMMARY_MAX_TOKENS = 2048   # Full professional case summary
+    SCORING_MAX_TOKENS = 2048   # Credibility score JSON with its reasoning lists
+    SCENE_MAX_TOKENS = 128      # One-sentence visual description
+    EXTRACTION_MAX_TOKENS = 512 # Entity extraction, forensic OCR/audio JSON, evidence description
+
+    # Shared client: keeps TCP/TLS connections to api.groq.com warm across calls
+    _http_client: Optional[httpx.AsyncClient] = None
+    # Caps concurrent requests when callers fan out with asyncio.gather
+    _semaphore: Optional[asyncio.Semaphore] = None
+    # Requests currently on the wire, by LLMResponseCache key (see _post_coalesced)
+    _inflight: Dict[bytes, "asyncio.Future[Optional[str]]"] = {}
+
+    @classmethod
+    def get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(settings.GROQ_MAX_CONCURRENCY)
+        return cls._semaphore
+
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.AsyncClient(
+                # Connect failures (nothing sent yet) are retried in the transport right away,
+                # also covering LLMAgent's fail-fast chat; 429/5xx backoff is _post_completion's
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=cls.CONNECT_RETRIES,
+                    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0),
+                ),
+                # Unreachable host fails within CONNECT_TIMEOUT instead of the full budget
+                timeout=httpx.Timeout(cls.TIMEOUT, connect=cls.CONNECT_TIMEOUT),
+                # Constant per process: sent on every request without rebuilding a dict per call.
+                # Bodies are pre-encoded with orjson (content=...), so the JSON type is set here.
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY.strip()}", "Content-Type": "application/json"},
+            )
+        return cls._http_client
+
+    @classmethod
+    async def aclose(cls):
+        """
+        Close the shared HTTP client (called from the FastAPI lifespan on shutdown).
+        """
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
+    @staticmethod
+    async def run_parallel(*coros) -> List[Any]:
+        """
+        Run independent Groq tasks concurrently (the semaphore still caps in-flight
+        requests). A failing task is logged and yields its exception in the result list
+        instead of cancelling the others.
+        """
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("groq_parallel_task_failed", error=str(result))
+        return results
+
+    @classmethod
+    async def _post_completion(cls, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        POST with retries for 429 / 5xx / transport errors: honors Retry-After when Groq
+        sends it, otherwise exponential backoff with jitter. Other 4xx fail immediately,
+        as does a Retry-After longer than MAX_RETRY_WAIT (fail fast rather than stall).
+        The semaphore is released while sleeping so other calls keep flowing.
+        """
+        body = orjson.dumps(payload)
+        for attempt in range(cls.MAX_ATTEMPTS):
+            last_attempt = attempt == cls.MAX_ATTEMPTS - 1
+            try:
+                async with cls.get_semaphore():
+                    status, headers, content = await cls._send(body)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                delay = cls._backoff(attempt)
+                logger.warning("groq_retry", error=str(e), attempt=attempt + 1, delay=delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if status == 200:
+                data = orjson.loads(content)
+                return data["choices"][0]["message"]["content"]
+
+            retryable = status == 429 or status >= 500
+            delay = cls._retry_after(headers) if retryable else None
+            if delay is None:
+                delay = cls._backoff(attempt)
+            if not retryable or last_attempt or delay > cls.MAX_RETRY_WAIT:
+                if status == 429:
+                    logger.error("groq_rate_limit_hit", status=429)
+                else:
+                    logger.error("groq_api_error", status=status, body=content[:500].decode(errors="replace"))
+                return None
+
+            logger.warning("groq_retry", status=status, attempt=attempt + 1, delay=delay)
+            await asyncio.sleep(delay)
+        return None
 
     @classmethod
-    async def _call_groq(cls, messages: List[Dict[str, Any]], schema_class: Optional[Type[T]] = None, model: str = TEXT_MODEL) -> Optional[T | str]:
+    async def _send(cls, body: bytes) -> Tuple[int, Mapping[str, str], bytes]:
+        """
+        One POST of a pre-encoded completion request: (status, headers, body bytes).
+        """
+        response = await cls.get_http_client().post(cls.BASE_URL, content=body)
+        return response.status_code, response.headers, response.content
+
+    @staticmethod
+    def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        try:
+            return float(headers["retry-after"])
+        except (KeyError, ValueError):
+            return None
+
+    @classmethod
+    def _backoff(cls, attempt: int) -> float:
+        return cls.RETRY_BASE_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    @classmethod
+    async def _post_coalesced(cls, payload: Dict[str, Any], key: bytes) -> Optional[str]:
+        """
+        Single-flight wrapper around _post_completion: concurrent callers with an identical
+        payload (same cache key) share one upstream request instead of each spending tokens
+        and a rate-limit slot. Followers get the leader's content (None on failure).
+        """
+        pending = cls._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        cls._inflight[key] = future
+        content = None
+        try:
+            content = await cls._post_completion(payload)
+            return content
+        finally:
+            del cls._inflight[key]
+            future.set_result(content)
+
+    @classmethod
+    async def _call_groq(cls, messages: List[Dict[str, Any]], schema_class: Optional[Type[T]] = None, model: str = TEXT_MODEL, max_tokens: int = DEFAULT_MAX_TOKENS) -> Optional[T | str]:
         if not settings.GROQ_API_KEY:
             logger.warning("groq_api_key_missing")
             return None
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {settings.GROQ_API_KEY}"
-        }
-        
-        # JSON Schema Enforcement
-        if schema_class:
-            system_instruction = f"You must output STRICT VALID JSON matching this schema: {schema_class.model_json_schema()}"
-            messages.insert(0, {"role": "system", "content": system_instruction})
+        # JSON Schema Enforcement: server-side constrained decoding where the model supports
+        # it, otherwise JSON mode plus the compact field descriptor as a system message
+        structured = schema_class is not None and model in cls.JSON_SCHEMA_MODELS
+        if schema_class and not structured:
+            messages = [_schema_message(schema_class), *messages]  # Caller's list stays untouched
             
         payload = {
             "model": model,
             "messages": messages,
             "temperature": 0.1, # Lower temperature for strict reasoning
-            "max_tokens": 2048,
+            "max_tokens": max_tokens,
         }
         
-        if schema_class:
+        if structured:
+            payload["response_format"] = _json_schema_format(schema_class)
+        elif schema_class:
             payload["response_format"] = {"type": "json_object"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    cls.BASE_URL, 
-                    headers=headers, 
-                    json=payload, 
-                    timeout=cls.TIMEOUT
-                )
-                
-                if response.status_code == 429:
-                    logger.error("groq_rate_limit_hit", status=429)
+        try:
+            # Identical payloads (incl. schema instruction) reuse the earlier completion
+            cache_key = LLMResponseCache.key(payload)
+            content = LLMResponseCache.get(cache_key)
+            if content is None:
+                content = await cls._post_coalesced(payload, cache_key)
+            if content is None:
+                return None
+            
+            if schema_class:
+                try:
+                    fenced = _CODE_FENCE_RE.match(content)
+                    clean = fenced.group(1) if fenced else content
+                    result = _parse_model(schema_class, clean)
+                except Exception as e:
+                    logger.error("groq_parse_error", error=str(e), content=content)
                     return None
+                LLMResponseCache.put(cache_key, content)
+                return result
                     
+            if content:
+                LLMResponseCache.put(cache_key, content)
+            return content
+
+        except Exception as e:
+            logger.error("groq_request_failed", error=str(e))
+            return None
+
+    @classmethod
+    async def _stream_groq(cls, messages: List[Dict[str, Any]], model: str = TEXT_MODEL, max_tokens: int = DEFAULT_MAX_TOKENS) -> AsyncIterator[str]:
+        """
+        Plain-text completion streamed as Server-Sent Events ("stream": true).
+        Yields content deltas as they are generated instead of waiting for the full body,
+        so callers can forward the first tokens after ~first-chunk latency.
+        Yields nothing on error (same fail-soft contract as _call_groq returning None).
+        """
+        if not settings.GROQ_API_KEY:
+            logger.warning("groq_api_key_missing")
+            return
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": 0.1,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+
+        try:
+            async with cls.get_http_client().stream("POST", cls.BASE_URL, content=orjson.dumps(payload)) as response:
                 if response.status_code != 200:
-                    logger.error("groq_api_error", status=response.status_code, body=response.text[:500])
-                    return None
-                    
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                
-                if schema_class:
-                    try:
-                        return schema_class.model_validate_json(content)
-                    except Exception as e:
-                        logger.error("groq_parse_error", error=str(e), content=content)
-                        return None
-                        
-                return content
-
-            except Exception as e:
-                logger.error("groq_request_failed", error=str(e))
-                return None
+                    body = await response.aread()
+                    logger.error("groq_api_error", status=response.status_code, body=body[:500].decode(errors="replace"))
+                    return
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue  # SSE comments / keep-alive blank lines
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+
+        except Exception as e:
+            logger.error("groq_stream_failed", error=str(e))
 
     @classmethod
     async def analyze_report(cls, report_text: str) -> Optional[AIAnalysisResult]:
         messages = [{
             "role": "user", 
-            "content": f"Analyze this report. Extract entities, language, and corruption type.\n\nReport: {report_text}"
+            "content": _ANALYZE_PROMPT + report_text
         }]
-        return await cls._call_groq(messages, AIAnalysisResult)
+        return await cls._call_groq(messages, AIAnalysisResult, model=cls.FAST_MODEL, max_tokens=cls.EXTRACTION_MAX_TOKENS)
+
+    @classmethod
+    def _translation_budget(cls, text: str) -> int:
+        # Translation output is about as long as the input (~1 token per 4 chars of English;
+        # Indic scripts tokenize denser, hence chars/2) plus headroom, capped at the default
+        return min(cls.DEFAULT_MAX_TOKENS, len(text) // 2 + 64)
 
     @classmethod
     async def translate_to_english(cls, text: str) -> str:
         messages = [{
             "role": "user",
-            "content": f"Translate to English (return original if already English): {text}"
+            "content": _TRANSLATE_PROMPT + text
         }]
-        result = await cls._call_groq(messages)
+        result = await cls._call_groq(messages, model=cls.FAST_MODEL, max_tokens=cls._translation_budget(text))
         return str(result) if result else text
 
     @classmethod
     async def analyze_evidence(cls, file_bytes: bytes, mime_type: str) -> Dict[str, Any]:
         # Legacy single-file analysis if needed, but Layer 1 is preferred now.
         # Keeping for backward compatibility or direct calls.
-        b64_image = base64.b64encode(file_bytes).decode('utf-8')
-        image_url = f"data:{mime_type};base64,{b64_image}"
-        prompt = "Analyze this image. Describe visible text and objects."
+        image_url = await asyncio.to_thread(_image_data_url, file_bytes, mime_type)
         messages = [{
             "role": "user",
             "content": [
-                {"type": "text", "text": prompt},
+                _EVIDENCE_TEXT_PART,
                 {"type": "image_url", "image_url": {"url": image_url}}
             ]
         }]
-        result_text = await cls._call_groq(messages, model=cls.VISION_MODEL)
+        result_text = await cls._call_groq(messages, model=cls.VISION_MODEL, max_tokens=cls.EXTRACTION_MAX_TOKENS)
         return {"analysis": result_text if result_text else "Visual analysis unavailable (Rate Limited)"}
 
     @classmethod
     async def perform_forensic_ocr_analysis(cls, ocr_text: str, narrative_summary: str) -> Optional[Any]: # Returns ForensicOCRAnalysis schema
-        from app.schemas.ai import ForensicOCRAnalysis
-        
-        system_prompt = """You are a forensic OCR text analysis module within Beacon Credibility Engine.
-
-You DO NOT perform OCR.
-OCR has already been executed using Tesseract.
-You ONLY analyze the extracted text provided to you.
-
-Your task is to:
-- Assess the quality and usefulness of the OCR output
-- Identify objective, verifiable signals
-- Detect relevance to the user’s narrative
-- Avoid assumptions, interpretations, or legal conclusions
-
---------------------------------------------------
-
-ANALYSIS RULES (STRICT):
-
-- Do NOT assume missing text implies absence of evidence
-- Do NOT infer intent, illegality, or wrongdoing
-- Do NOT correct OCR errors unless they are obvious formatting issues
-- Treat low-quality or noisy OCR neutrally, not negatively
-
---------------------------------------------------
-
-ANALYZE FOR THE FOLLOWING OBJECTIVE SIGNALS:
-
-1. TEXT PRESENCE
-- Is meaningful text present or mostly noise?
-
-2. FACTUAL ELEMENTS
-Identify whether the OCR text contains:
-- Dates
-- Monetary amounts
-- Names (persons or organizations)
-- Locations
-- Official indicators (letterheads, stamps, IDs, reference numbers)
-
-3. RELEVANCE ALIGNMENT
-- Do any extracted elements align with the user’s claimed facts?
-- Alignment can be partial or indirect
-
-4. LIMITATIONS
-- Note missing, unclear, or unreadable portions
-- Note OCR ambiguity without speculation
-
---------------------------------------------------
-
-FINAL SAFETY RULE:
-This analysis reflects OCR text characteristics only.
-It does not verify authenticity, truth, or legality of the content.
-"""
         messages = [
-            {"role": "system", "content": system_prompt},
+            _OCR_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": (
@@ -182,75 +646,22 @@ It does not verify authenticity, truth, or legality of the content.
             }
         ]
         
-        return await cls._call_groq(messages, ForensicOCRAnalysis)
+        return await cls._call_groq(messages, ForensicOCRAnalysis, model=cls.REASONING_MODEL, max_tokens=cls.EXTRACTION_MAX_TOKENS)
 
     @classmethod
     async def perform_forensic_audio_analysis(cls, transcript_text: str, narrative_summary: str, audio_metadata: dict = None) -> Optional[Any]:
-        from app.schemas.ai import ForensicAudioAnalysis
         
         metadata_str = ""
         if audio_metadata:
-            metadata_str = f"""
-TRANSCRIPTION_METADATA:
-- Audio clarity: {audio_metadata.get('clarity', 'unknown')}
-- Multiple speakers: {audio_metadata.get('multiple_speakers', 'unclear')}
-- Duration: {audio_metadata.get('duration_seconds', 'unknown')} seconds
-- Language: {audio_metadata.get('language', 'unknown')}
-"""
+            metadata_str = (
+                f"TRANSCRIPTION_METADATA: clarity={audio_metadata.get('clarity', 'unknown')}, "
+                f"multiple_speakers={audio_metadata.get('multiple_speakers', 'unclear')}, "
+                f"duration={audio_metadata.get('duration_seconds', 'unknown')}s, "
+                f"language={audio_metadata.get('language', 'unknown')}\n"
+            )
         
-        system_prompt = """You are a forensic audio/video transcription analysis module within the Beacon Credibility Engine.
-
-You DO NOT process media files.
-You DO NOT perform audio decoding or transcription.
-Audio/video preprocessing was completed using FFmpeg, and transcription was produced by an external speech-to-text system.
-
-Your role is ONLY to analyze the resulting transcription and metadata objectively.
-
---------------------------------------------------
-
-STRICT ANALYSIS RULES:
-
-- Do NOT assume the speaker's intent, identity, or role
-- Do NOT infer illegality, corruption, or wrongdoing
-- Do NOT "clean up" speech beyond basic readability
-- Treat unclear or partial transcription neutrally
-- Absence of relevant speech is NOT evidence of falsehood
-
---------------------------------------------------
-
-ANALYZE FOR THE FOLLOWING OBJECTIVE SIGNALS:
-
-1. TRANSCRIPTION USABILITY
-- Is meaningful speech present or mostly noise?
-- Is the audio sufficiently intelligible to extract facts?
-
-2. FACTUAL ELEMENTS IN SPEECH
-Identify whether the transcription includes:
-- Dates or time references
-- Monetary amounts
-- Names (people or organizations)
-- Locations
-- References to documents, payments, or official actions
-(Note: Listing presence only, not interpretation.)
-
-3. NARRATIVE ALIGNMENT
-- Do any spoken elements align with the user's claimed facts?
-- Alignment may be partial, indirect, or contextual
-
-4. LIMITATIONS & AMBIGUITIES
-- Overlapping speakers
-- Poor audio quality
-- Missing segments
-- Language uncertainty
-
---------------------------------------------------
-
-FINAL SAFETY STATEMENT:
-This analysis reflects transcription characteristics only.
-It does not verify speaker identity, authenticity, intent, legality, or factual truth.
-"""
         messages = [
-            {"role": "system", "content": system_prompt},
+            _AUDIO_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": (
@@ -261,7 +672,7 @@ It does not verify speaker identity, authenticity, intent, legality, or factual
             }
         ]
         
-        return await cls._call_groq(messages, ForensicAudioAnalysis)
+        return await cls._call_groq(messages, ForensicAudioAnalysis, model=cls.REASONING_MODEL, max_tokens=cls.EXTRACTION_MAX_TOKENS)
 
     @classmethod
     async def perform_forensic_visual_analysis(cls, image_bytes: bytes, mime_type: str) -> Optional[str]:
@@ -269,123 +680,118 @@ It does not verify speaker identity, authenticity, intent, legality, or factual
         Qualitative scene description for Layer 2.
         NEUTRAL and OBJECTIVE.
         """
-        b64_image = base64.b64encode(image_bytes).decode('utf-8')
-        image_url = f"data:{mime_type};base64,{b64_image}"
+        image_url = await asyncio.to_thread(_image_data_url, image_bytes, mime_type)
         
-        prompt = """Describe the scene in this image in ONE SHORT SENTENCE. 
-Focus on:
-1. Actors (e.g., uniformed personnel, civilian, office clerk, shopkeeper)
-2. Environment (e.g., road, office, shop, indoors)
-3. Key objects (e.g., documents, money, vehicle)
-
-Keep it neutral. Example: 'Uniformed officer standing on a road next to a vehicle.'
-"""
         messages = [{
             "role": "user",
             "content": [
-                {"type": "text", "text": prompt},
+                _VISUAL_TEXT_PART,
                 {"type": "image_url", "image_url": {"url": image_url}}
             ]
         }]
         
-        result = await cls._call_groq(messages, model=cls.VISION_MODEL)
+        result = await cls._call_groq(messages, model=cls.VISION_MODEL, max_tokens=cls.SCENE_MAX_TOKENS)
         return str(result).strip() if result else None
 
-    @classmethod
-    async def generate_pro_summary(cls, chat_history: List[Dict[str, str]]) -> str:
-        conversation_text = "\n".join([f"{msg['role'].upper()}: {msg['content']}" for msg in chat_history])
-        messages = [{
+    # Title prefixes the model sometimes emits despite the instruction
+    SUMMARY_PREFIXES = ("Intelligence Summary:", "Summary:", "Report Summary:")
+
+    @staticmethod
+    def format_history(chat_history: List[Dict[str, str]]) -> str:
+        """
+        Budgeted transcript used by the summary and scoring prompts. Callers running both
+        for one report format once and pass it as conversation_text.
+        """
+        return _format_history(chat_history)
+
+    @staticmethod
+    def _summary_messages(chat_history: List[Dict[str, str]], conversation_text: Optional[str] = None) -> List[Dict[str, Any]]:
+        if conversation_text is None:
+            conversation_text = _format_history(chat_history)
+        return [{
             "role": "user",
             "content": (
-                "Write a professional intelligence summary of this report. "
-                "Preserve details (dates, names, amounts). Anonymize the reporter. "
-                "No fluff. Just the facts. "
-                "CRITICAL: Do NOT include a title, header, or prefix like 'Intelligence Summary:'. "
-                "Start directly with the summary content.\n\n"
-                f"Log:\n{conversation_text}"
+                f"{_SUMMARY_INSTRUCTION}\n\nLog:\n{conversation_text}"
             )
         }]
-        result = await cls._call_groq(messages)
+
+    @classmethod
+    def _strip_summary_prefix(cls, summary: str) -> str:
+        for prefix in cls.SUMMARY_PREFIXES:
+            if summary.startswith(prefix):
+                summary = summary[len(prefix):].lstrip()
+        return summary
+
+    @classmethod
+    async def generate_pro_summary(cls, chat_history: List[Dict[str, str]], conversation_text: Optional[str] = None) -> str:
+        result = await cls._call_groq(cls._summary_messages(chat_history, conversation_text), model=cls.REASONING_MODEL, max_tokens=cls.SUMMARY_MAX_TOKENS)
         if not result:
             return "No summary generated."
             
-        summary = str(result).strip()
         # Cleanup: Forcefully remove common prefixes if the LLM ignores instructions
-        prefixes_to_strip = ["Intelligence Summary:", "Summary:", "Report Summary:"]
-        for prefix in prefixes_to_strip:
-            if summary.startswith(prefix):
-                summary = summary[len(prefix):].strip()
-        
-        return summary
+        return cls._strip_summary_prefix(str(result).strip())
+
+    @classmethod
+    async def generate_pro_summary_stream(cls, chat_history: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Streaming variant of generate_pro_summary. The first few characters are held back
+        until a title prefix can be ruled out, then deltas are forwarded as they arrive.
+        """
+        head_len = max(len(p) for p in cls.SUMMARY_PREFIXES)
+        head = ""
+        async for chunk in cls._stream_groq(cls._summary_messages(chat_history), model=cls.REASONING_MODEL, max_tokens=cls.SUMMARY_MAX_TOKENS):
+            if head is None:
+                yield chunk
+                continue
+            head += chunk
+            if len(head) >= head_len:
+                head = cls._strip_summary_prefix(head.lstrip())
+                if head:
+                    yield head
+                head = None
+        if head:
+            yield cls._strip_summary_prefix(head.strip())
+        elif head == "":
+            yield "No summary generated."
 
     @classmethod
     async def calculate_credibility_score(
         cls, 
         chat_history: List[Dict[str, str]], 
         evidence_metadata: List[EvidenceMetadata], 
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        conversation_text: Optional[str] = None
     ) -> Optional[ScoringResult]:
         
-        conversation_text = "\n".join([f"{msg['role'].upper()}: {msg['content']}" for msg in chat_history])
+        if conversation_text is None:
+            conversation_text = _format_history(chat_history)
         
         # Build Layer 1 Deterministic Summary for the LLM
         evidence_digest = "NO EVIDENCE PROVIDED"
         if evidence_metadata:
-            digest_lines = []
-            for ev in evidence_metadata:
-                status = "VALID"
-                if ev.is_empty_or_corrupt: status = "CORRUPT/EMPTY"
-                elif ev.is_duplicate: status = "DUPLICATE"
-                
-                digest_lines.append(f"- File: {ev.file_name} ({ev.file_type}) [{status}]")
-                digest_lines.append(f"  OCR Text: {ev.ocr_text_snippet if ev.ocr_text_snippet else '[NO TEXT DETECTED]'}")
-                digest_lines.append(f"  Visual Signals: {', '.join(ev.object_labels) if ev.object_labels else '[OFFICE/CURRENCY SIGNALS NOT FOUND]'}")
-                if ev.audio_transcript_snippet:
-                    digest_lines.append(f"  Audio Transcript: {ev.audio_transcript_snippet}")
-            evidence_digest = "\n".join(digest_lines)
-
-        system_prompt = """You are Beacon Credibility Engine.
-You are a forensic consistency analyst assessing whether provided evidence meaningfully supports a corruption claim.
-
-CORE PRINCIPLES:
-1. Credibility != Truth. You assess coherence, not guilt.
-2. Evidence validates narrative. If evidence is unrelated (e.g., ashtray photo for a bribe claim), it is a STRONG NEGATIVE SIGNAL.
-3. Be skeptical of polished stories with unrelated attachments.
-
-SCORING RUBRIC (Strictly Enforced):
-
-1. NARRATIVE CREDIBILITY (0-40)
-   - Evaluates: Internal consistency, specific details (dates, names, amounts), logical flow.
-   - Penalize: Contradictions, vagueness, emotional instead of factual language.
-
-2. EVIDENCE STRENGTH (0-40)
-   - Evaluates: Relevance and alignment between Evidence Digest and the Narrative.
-   - RELEVANCE CHECK: Does the visual signal or OCR directly correlate with the narrative?
-   - ACTOR/ENVIRONMENT MATCH: If the narrative mentions a specific actor (e.g., Shopkeeper) but the Visual Context describes a different one (e.g., Police Officer), this is a CRITICAL MISMATCH. Score = 0-10.
-   - REWARD: If the narrative mentions "cash" or "money" AND Visual Signals show "possible_currency_colors", Score = 25-35.
-   - REWARD: If the narrative mentions a location/office AND Visual Signals show "possible_document_layout", Score = 20-30.
-   - VISUAL WEIGHT: Do NOT penalize an image for missing text (OCR) if the Visual Description strongly matches the scene (e.g. corruption event in progress). Text is secondary for photos.
-   - CRITICAL PENALTY: If the evidence is entirely unrelated (e.g. ashtray) or shows a role mismatch as noted above.
-   - CONSTRAINT: If the provided Evidence Digest shows "[NO TEXT DETECTED]" for a document claim, and no visual signals match, Score < 10.
-
-3. BEHAVIORAL RELIABILITY (0-20)
-   - Evaluates: Stability, cooperation, natural timing.
-   - Penalize: Evasiveness, robotic repetition.
+            evidence_digest = "\n".join([_digest_entry(ev) for ev in evidence_metadata])
 
-TOTAL SCORE = Sum(Subscores). Max 100.
-"""
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            _SCORING_SYSTEM_MESSAGE,
             {
                 "role": "user", 
                 "content": (
                     "Evaluate this case.\n\n"
                     f"--- NARRATIVE ---\n{conversation_text}\n\n"
                     f"--- LAYER 1 EVIDENCE DIGEST (DETERMINISTIC) ---\n{evidence_digest}\n\n"
-                    f"--- METADATA ---\n{json.dumps(metadata, default=str)}"
+                    f"--- METADATA ---\n{orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS).decode()}"
                 )
             }
         ]
         
-        return await cls._call_groq(messages, ScoringResult)
+        return await cls._call_groq(messages, ScoringResult, model=cls.REASONING_MODEL, max_tokens=cls.SCORING_MAX_TOKENS)
+
+
+# Warm the per-schema caches at import time so the first live request doesn't pay for the
+# descriptor walk / JSON Schema generation (pydantic builds validators at class creation).
+for _schema in (AIAnalysisResult, ForensicOCRAnalysis, ForensicAudioAnalysis, ScoringResult):
+    _schema_message(_schema)
+    _trusted_fields(_schema)
+    _adapter(_schema)
+    _json_schema_format(_schema)
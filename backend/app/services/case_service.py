@@ -1,4 +1,5 @@
 from sqlalchemy import select, func, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.beacon import Beacon
 import structlog
@@ -14,13 +15,47 @@ class CaseService:
     PREFIX = "BCN"
     DIGITS = 12
     STARTING_ID_NUM = 100000000001 # As requested: BCN100000000001
+    SEQUENCE = "beacon_case_id_seq"  # Created by upgrade_supabase.py
+    UNDEFINED_TABLE = "42P01"  # SQLSTATE Postgres raises for a missing relation (incl. sequences)
+
+    # None until the first call finds out whether the sequence exists (per process)
+    _has_sequence = None
     
     @classmethod
     async def generate_next_case_id(cls, session: AsyncSession) -> str:
         """
         Generates the next incremental Case ID.
         Format: BCN + 12 digits (e.g. BCN100000000001).
-        
+
+        Uses nextval() on the case ID sequence: one atomic round-trip, so concurrent
+        submissions can never draw the same number. Databases that haven't run
+        upgrade_supabase.py yet fall back to the max() scan below.
+        """
+        if cls._has_sequence is not False:
+            try:
+                stmt = text(f"SELECT nextval('{cls.SEQUENCE}')")
+                if cls._has_sequence:
+                    next_num = (await session.execute(stmt)).scalar_one()
+                else:
+                    # First probe in a savepoint: a missing sequence must not abort the caller's transaction
+                    async with session.begin_nested():
+                        next_num = (await session.execute(stmt)).scalar_one()
+                    cls._has_sequence = True
+                return f"{cls.PREFIX}{next_num}"
+            except DBAPIError as e:
+                # Only a missing sequence switches to the fallback; anything else (lost
+                # connection, timeout, ...) is raised without caching a verdict
+                if cls._has_sequence or getattr(e.orig, "pgcode", None) != cls.UNDEFINED_TABLE:
+                    raise
+                cls._has_sequence = False
+                logger.warning("case_id_sequence_missing", sequence=cls.SEQUENCE, error=str(e))
+        return await cls._generate_from_max(session)
+
+    @classmethod
+    async def _generate_from_max(cls, session: AsyncSession) -> str:
+        """
+        Legacy ID generation (no sequence).
+
         Logic:
         1. Find the maximum existing Case ID that matches the pattern BCN + digits.
         2. Extract numbers, increment by 1.
@@ -1,11 +1,15 @@
 import os
-import json
 import httpx
+import orjson
 import re
 import secrets
 import asyncio
+import structlog
 from typing import Tuple, Optional
 from app.core.config import settings
+from app.services.ai_service import GroqService
+
+logger = structlog.get_logger()
 
 SYSTEM_PROMPT = """You are Beacon AI — a calm, trustworthy, and respectful assistant helping citizens report corruption safely and anonymously.
 
@@ -106,13 +110,16 @@ class LLMAgent:
     GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
     # Downgraded to 8B for faster response and higher rate limits
     GROQ_MODEL = "llama-3.1-8b-instant"
+    # Chat context: at least the last HISTORY_WINDOW messages; the window start advances in
+    # HISTORY_STEP jumps so consecutive turns share the same cached prompt prefix.
+    HISTORY_WINDOW = 15
+    HISTORY_STEP = 10
     
     @staticmethod
     async def chat(conversation_history: list, current_state: dict = None) -> Tuple[str, Optional[dict]]:
-        print(f"[LLM_AGENT] chat() called with {len(conversation_history)} messages", flush=True)
         api_key = settings.GROQ_API_KEY
         if not api_key:
-            print(f"[LLM_AGENT] No API key found, using mock", flush=True)
+            logger.warning("llm_agent_no_api_key")
             return await LLMAgent._mock_chat(conversation_history, current_state)
 
         # 1. CLEAN HISTORY & STATE
@@ -129,13 +136,14 @@ class LLMAgent:
         summary_text = "\n".join(summary_parts) if summary_parts else "No information yet."
 
         # 2. CONSTRUCT PROMPT
-        full_system_prompt = f"{SYSTEM_PROMPT}\n\n### [CONFIRMED FACTS] ###\n{summary_text}\n##########################"
-        
-        messages = [{"role": "system", "content": full_system_prompt}]
-        # Provide enough context for extraction logic
-        recent_history = conversation_history[-15:] if len(conversation_history) > 15 else conversation_history
-        for msg in recent_history:
+        # Ordered for Groq's automatic prompt (prefix) caching: the static system prompt first,
+        # then the history, then the per-turn facts last so they don't invalidate the prefix.
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        # Provide enough context for extraction logic (window start only moves every HISTORY_STEP turns)
+        window_start = max(0, len(conversation_history) - LLMAgent.HISTORY_WINDOW) // LLMAgent.HISTORY_STEP * LLMAgent.HISTORY_STEP
+        for msg in conversation_history[window_start:]:
              messages.append({"role": msg["role"].lower(), "content": msg["content"]})
+        messages.append({"role": "system", "content": f"### [CONFIRMED FACTS] ###\n{summary_text}\n##########################"})
             
         # 3. PREPARE PAYLOAD
         payload = {
@@ -145,73 +153,65 @@ class LLMAgent:
             "max_tokens": 1024
         }
         
-        headers = {
-            "Authorization": f"Bearer {api_key.strip()}",
-            "Content-Type": "application/json"
-        }
-        
         # 4. API CALL (FAIL-FAST STRATEGY)
         # We try ONCE. If rate limited, we fail immediately to prevent frontend freezing.
         try:
-            async with httpx.AsyncClient() as client:
-                # Reduced timeout to 10s as requested
-                response = await client.post(LLMAgent.GROQ_API_URL, json=payload, headers=headers, timeout=10.0)
+            # Shared keep-alive client (auth/JSON headers set once); no semaphore, chat must not
+            # queue behind background scoring. The client's timeout applies (10s, 5s connect)
+            response = await GroqService.get_http_client().post(LLMAgent.GROQ_API_URL, content=orjson.dumps(payload))
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                text_response = data["choices"][0]["message"]["content"]
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    text_response = data["choices"][0]["message"]["content"]
-                    
-                    # Extract fresh JSON
-                    fresh_extracted = LLMAgent._extract_report(text_response) or {}
-                    
-                    # Merge with State (Trust LLM's latest extraction if it's not empty)
-                    final_report_to_save = state.copy()
-                    for k in track_fields:
-                        v = fresh_extracted.get(k)
-                        val = str(v).strip() if v is not None else ""
-                        if val and val.lower() not in ["", "none", "unknown", "null", "..."]:
-                            # Update if different or currently empty
-                            old_val = str(state.get(k) or "").lower()
-                            if val.lower() != old_val:
-                                final_report_to_save[k] = val
-                    
-                    clean_response = LLMAgent._clean_response(text_response)
-                    
-                    # Placeholder Consistency Fix (Case-insensitive catch-all)
-                    clean_response = re.sub(r"case_id_placeholder", "CASE_ID_PLACEHOLDER", clean_response, flags=re.I)
-                    clean_response = re.sub(r"secret_key_placeholder", "SECRET_KEY_PLACEHOLDER", clean_response, flags=re.I)
-                    
-                    # Fix for hallucinations (BCN-XXXX or similar)
-                    if "case id" in clean_response.lower() and "secret key" in clean_response.lower():
-                        if "CASE_ID_PLACEHOLDER" not in clean_response:
-                            clean_response = re.sub(r"BCN-\d+", "CASE_ID_PLACEHOLDER", clean_response)
-                            if "CASE_ID_PLACEHOLDER" not in clean_response:
-                                clean_response = re.sub(r"(Case ID is\s+)([A-Z0-9-]+)", r"\1CASE_ID_PLACEHOLDER", clean_response, flags=re.I)
-                        
-                        if "SECRET_KEY_PLACEHOLDER" not in clean_response:
-                            clean_response = re.sub(r"(Secret Key is\s+)([A-Z0-9-]+)", r"\1SECRET_KEY_PLACEHOLDER", clean_response, flags=re.I)
-
-                    return clean_response, final_report_to_save
-
-                elif response.status_code == 429:
-                    print(f"[LLM_AGENT] Rate limit hit (429). Returning fallback immediately.", flush=True)
-                    return "I'm currently experiencing very high traffic interactions. Please try sending your message again in a few seconds.", state
+                # Extract fresh JSON
+                fresh_extracted = LLMAgent._extract_report(text_response) or {}
+                
+                # Merge with State (Trust LLM's latest extraction if it's not empty)
+                final_report_to_save = state.copy()
+                for k in track_fields:
+                    v = fresh_extracted.get(k)
+                    val = str(v).strip() if v is not None else ""
+                    if val and val.lower() not in ["", "none", "unknown", "null", "..."]:
+                        # Update if different or currently empty
+                        old_val = str(state.get(k) or "").lower()
+                        if val.lower() != old_val:
+                            final_report_to_save[k] = val
+                
+                clean_response = LLMAgent._clean_response(text_response)
                 
-                else:
-                    print(f"[LLM_AGENT] API Error {response.status_code}: {response.text}", flush=True)
-                    # Fall through to mock
+                # Placeholder Consistency Fix (Case-insensitive catch-all)
+                clean_response = re.sub(r"case_id_placeholder", "CASE_ID_PLACEHOLDER", clean_response, flags=re.I)
+                clean_response = re.sub(r"secret_key_placeholder", "SECRET_KEY_PLACEHOLDER", clean_response, flags=re.I)
+                
+                # Fix for hallucinations (BCN-XXXX or similar)
+                if "case id" in clean_response.lower() and "secret key" in clean_response.lower():
+                    if "CASE_ID_PLACEHOLDER" not in clean_response:
+                        clean_response = re.sub(r"BCN-\d+", "CASE_ID_PLACEHOLDER", clean_response)
+                        if "CASE_ID_PLACEHOLDER" not in clean_response:
+                            clean_response = re.sub(r"(Case ID is\s+)([A-Z0-9-]+)", r"\1CASE_ID_PLACEHOLDER", clean_response, flags=re.I)
+                    
+                    if "SECRET_KEY_PLACEHOLDER" not in clean_response:
+                        clean_response = re.sub(r"(Secret Key is\s+)([A-Z0-9-]+)", r"\1SECRET_KEY_PLACEHOLDER", clean_response, flags=re.I)
+
+                return clean_response, final_report_to_save
+
+            elif response.status_code == 429:
+                logger.warning("llm_agent_rate_limited")
+                return "I'm currently experiencing very high traffic interactions. Please try sending your message again in a few seconds.", state
+            
+            else:
+                logger.error("llm_agent_api_error", status=response.status_code, body=response.content[:500].decode(errors="replace"))
+                # Fall through to mock
 
         except httpx.TimeoutException:
-            print("[LLM_AGENT] Groq API timed out (10s). Returning fallback.", flush=True)
+            logger.warning("llm_agent_timeout")
             return "I'm having a little trouble connecting to the server. Could you please say that again?", state
             
         except Exception as e:
-            print(f"[LLM_AGENT] Unexpected error during chat: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.exception("llm_agent_chat_failed", error=str(e))
 
         # Final Fallback
-        print(f"[LLM_AGENT] Falling back to generic response", flush=True)
         return await LLMAgent._mock_chat(conversation_history, current_state)
 
     @staticmethod
@@ -255,7 +255,7 @@ class LLMAgent:
                 json_str = matches[-1].strip()
                 last_brace = json_str.rfind('}')
                 if last_brace != -1: json_str = json_str[:last_brace+1]
-                return json.loads(json_str)
+                return orjson.loads(json_str)
             except: pass
         return None
 
@@ -265,19 +265,16 @@ class LLMAgent:
         api_key = settings.GROQ_API_KEY
         if not api_key: return raw_text
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    LLMAgent.GROQ_API_URL,
-                    json={
-                        "model": "llama-3.1-8b-instant",
-                        "messages": [{"role": "system", "content": UPDATE_SYSTEM_PROMPT}, {"role": "user", "content": raw_text}],
-                        "temperature": 0.1, "max_tokens": 150
-                    },
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=10.0
-                )
-                if response.status_code == 200:
-                    return response.json()["choices"][0]["message"]["content"].strip()
+            response = await GroqService.get_http_client().post(
+                LLMAgent.GROQ_API_URL,
+                content=orjson.dumps({
+                    "model": "llama-3.1-8b-instant",
+                    "messages": [{"role": "system", "content": UPDATE_SYSTEM_PROMPT}, {"role": "user", "content": raw_text}],
+                    "temperature": 0.1, "max_tokens": 150
+                }),
+            )
+            if response.status_code == 200:
+                return orjson.loads(response.content)["choices"][0]["message"]["content"].strip()
         except: pass
         return raw_text
 
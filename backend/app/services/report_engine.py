@@ -13,9 +13,8 @@ Key Rules:
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 from datetime import datetime, timezone
-import json
 import uuid
 import base64
 import os
@@ -35,6 +34,7 @@ from app.models.beacon import Beacon
 from app.schemas.report import MessageResponse
 from app.services.llm_agent import LLMAgent
 from app.services.case_service import CaseService
+from app.services.state_cache import SessionStateCache
 from app.models.report import SenderType
 from uuid import UUID as UUIDType
 from passlib.context import CryptContext
@@ -60,7 +60,7 @@ class ReportEngine:
     - One row per case (INSERT once)
     - reported_at, case_id, incident_summary
     - credibility_score, score_explanation
-    - evidence_files (Base64 encoded)
+    - evidence_files (storage references only, bytes live in Supabase Storage)
     """
     
     @staticmethod
@@ -80,14 +80,15 @@ class ReportEngine:
         """
         try:
             async with LocalAsyncSession() as local_session:
-                print(f"[REPORT_ENGINE] STAGE 1: Store user message: {report_id}", flush=True)
-                user_msg = LocalConversation(
-                    session_id=report_id,
-                    sender=LocalSenderType.USER,
-                    content=user_message
-                )
-                local_session.add(user_msg)
-                await local_session.flush()
+                # Buffered: the user message and the AI reply are written together in one
+                # multi-row INSERT once the reply exists (see STAGE 4 below)
+                from app.core.time_utils import get_utc_now
+                turn_rows = [{
+                    "session_id": report_id,
+                    "sender": LocalSenderType.USER,
+                    "content": user_message,
+                    "created_at": get_utc_now(),
+                }]
                 
                 # 1.5. CHECK FOR & PROCESS NEW EVIDENCE (FAST VISION MODE - Stage A)
                 # Replaced heavy EvidenceProcessor with lightweight Grok Vision call
@@ -109,21 +110,27 @@ class ReportEngine:
                 result = await local_session.execute(stmt)
                 history_objs = result.scalars().all()
                 
-                # Fetch persistent state context
-                state_stmt = select(LocalStateTracking).where(LocalStateTracking.session_id == report_id)
-                state_res = await local_session.execute(state_stmt)
-                state_tracking = state_res.scalar_one_or_none()
-                
-                if not state_tracking:
-                    # Auto-initialize if missing (Safety Net)
-                    await ReportEngine.initialize_report(report_id, "tk_auto_gen")
+                # Fetch persistent state context (in-process cache first, SQLite on miss/stale)
+                history_len = len(history_objs)
+                context_data = SessionStateCache.get(report_id, history_len)
+                state_exists = context_data is not None
+                if context_data is None:
                     state_stmt = select(LocalStateTracking).where(LocalStateTracking.session_id == report_id)
                     state_res = await local_session.execute(state_stmt)
                     state_tracking = state_res.scalar_one_or_none()
+                    
+                    if not state_tracking:
+                        # Auto-initialize if missing (Safety Net)
+                        await ReportEngine.initialize_report(report_id, "tk_auto_gen")
+                        state_stmt = select(LocalStateTracking).where(LocalStateTracking.session_id == report_id)
+                        state_res = await local_session.execute(state_stmt)
+                        state_tracking = state_res.scalar_one_or_none()
+
+                    state_exists = state_tracking is not None
+                    context_data = dict(state_tracking.context_data or {}) if state_exists else {}
 
-                current_state = {}
-                if state_tracking and state_tracking.context_data:
-                    current_state = dict(state_tracking.context_data.get("extracted", {}))
+                current_state = dict(context_data.get("extracted", {}))
+                state_changed = False  # Written through to SQLite this turn
                 
                 # --- NEW EVIDENCE LOGIC ---
                 last_count = int(current_state.get("evidence_count", 0))
@@ -157,11 +164,8 @@ class ReportEngine:
                     current_state["evidence_count"] = current_count
                     current_state["evidence"] = "Uploaded" # Mark evidence as provided
                     
-                    # Persist this specific state update immediately so we don't re-process if LLM crashes
-                    new_context_data = dict(state_tracking.context_data or {})
-                    new_context_data["extracted"] = current_state
-                    state_tracking.context_data = new_context_data
-                    await local_session.flush()
+                    context_data = {**context_data, "extracted": current_state}
+                    state_changed = True
 
                 # Convert to LLM format
                 conversation_history = []
@@ -173,6 +177,8 @@ class ReportEngine:
                         "role": role,
                         "content": msg.content
                     })
+                # Current turn (not yet in the DB)
+                conversation_history.append({"role": "user", "content": user_message})
                 
                 # INJECT EVIDENCE CONTEXT (System Injection)
                 # ONLY inject if we just processed NEW evidence
@@ -184,32 +190,28 @@ class ReportEngine:
 
                 # 3. Forward to LLM (LLM is sole conversational authority)
                 # Pass current_state to LLM so it knows what it ALREADY confirmed
-                print(f"[REPORT_ENGINE] STAGE 2: LLM Request starting: {report_id}", flush=True)
                 llm_response, new_extracted_data = await LLMAgent.chat(conversation_history, current_state)
-                print(f"[REPORT_ENGINE] STAGE 3: LLM Response received: {len(llm_response or '')} chars", flush=True)
                 
                 # Update persistent state if new info discovered
-                if new_extracted_data and state_tracking:
+                if new_extracted_data and state_exists:
                     # Merge logic: New data overwrites/adds to old data
                     updated_state = current_state.copy()
                     for k, v in new_extracted_data.items():
                         if v and v != "...": # Only merge meaningful data
                             updated_state[k] = v
                     
-                    # Store back to context_data
-                    # Use a fresh dict to ensure SQLAlchemy detects change
-                    new_context_data = dict(state_tracking.context_data)
-                    new_context_data["extracted"] = updated_state
-                    state_tracking.context_data = new_context_data  # CRITICAL: Assign back!
-                    await local_session.flush()
+                    # Store back to context_data (fresh dict: the cached one is never mutated in place)
+                    context_data = {**context_data, "extracted": updated_state}
+                    state_changed = True
 
-                # 4. Store LLM response locally
-                sys_msg = LocalConversation(
-                    session_id=report_id,
-                    sender=LocalSenderType.SYSTEM,
-                    content=llm_response
-                )
-                local_session.add(sys_msg)
+                # 4. Store user message + LLM response locally (single executemany INSERT)
+                turn_rows.append({
+                    "session_id": report_id,
+                    "sender": LocalSenderType.SYSTEM,
+                    "content": llm_response,
+                    "created_at": get_utc_now(),
+                })
+                await local_session.execute(insert(LocalConversation), turn_rows)
                 
                 # Use merged state for final report if submittted
                 final_report = new_extracted_data if new_extracted_data else current_state
@@ -230,6 +232,14 @@ class ReportEngine:
                 ]
                 
                 has_placeholder = any(re.search(p, llm_response, re.IGNORECASE) for p in completion_patterns)
+
+                # Persist changed state on the same turn (another worker may serve the next one)
+                if state_exists and state_changed:
+                    await local_session.execute(
+                        update(LocalStateTracking)
+                        .where(LocalStateTracking.session_id == report_id)
+                        .values(context_data=context_data)
+                    )
                 
                 if has_placeholder:
                     try:
@@ -262,7 +272,6 @@ class ReportEngine:
                              llm_response += f"\n\nYour Secret Key is {secret_key_display}. Please save this."
                         
                         # Get reported_at timestamp
-                        from app.core.time_utils import get_utc_now
                         reported_at_utc = get_utc_now()
                         
                         # Gather evidence files
@@ -326,6 +335,12 @@ class ReportEngine:
 
                 # Always commit local session (messages + state) for every turn
                 await local_session.commit()
+
+                # Cache only committed state, valid for the next turn once this turn's two messages exist
+                if state_exists and not has_placeholder:
+                    SessionStateCache.put(report_id, context_data, history_len + 2)
+                else:
+                    SessionStateCache.evict(report_id)  # Session is finishing (or has no state row)
                 
                 return MessageResponse(
                     report_id=UUIDType(report_id),  # Convert string to UUID
@@ -351,6 +366,7 @@ class ReportEngine:
     async def _upload_evidence_and_get_metadata(session_id: str, local_session: AsyncSession) -> list:
         """
         Uploads evidence files to Supabase Storage in parallel and returns metadata list.
+        Only references are returned (no file content) so beacon rows stay small.
         """
         from app.services.storage_service import StorageService
         import asyncio
@@ -387,13 +403,16 @@ class ReportEngine:
                         "full_url": public_url,
                         "file_name": ev.file_name,
                         "mime_type": ev.mime_type,
-                        "size_bytes": 0, # Unknown, but maybe not critical for flow
+                        "size_bytes": ev.size_bytes,
+                        "sha256": ev.file_hash,
                         "storage_provider": "supabase"
                     }
 
                 with open(ev.file_path, "rb") as f:
                     file_bytes = f.read()
-                return await StorageService.upload_file(file_bytes, ev.file_name, ev.mime_type)
+                upload_res = await StorageService.upload_file(file_bytes, ev.file_name, ev.mime_type)
+                upload_res["sha256"] = ev.file_hash
+                return upload_res
             except Exception as e:
                 print(f"[REPORT_ENGINE] Error uploading evidence file {ev.file_path}: {e}")
                 return {"file_name": ev.file_name, "error": str(e)}
@@ -408,7 +427,7 @@ class ReportEngine:
         Initialize a new report session in LOCAL SQLite.
         """
         import hashlib
-        token_hash = hashlib.sha256(access_token.encode()).hexdigest()
+        token_hash = hashlib.sha256(access_token.encode()).digest()  # 32 raw bytes, half the size of hex
 
         async with LocalAsyncSession() as local_session:
             # Check if session already exists
@@ -0,0 +1,67 @@
+"""
+In-process cache of Groq completions for identical requests.
+
+Translation, report analysis and summaries are deterministic enough (temperature 0.1)
+that re-sending the exact same payload (drafts re-submitted, re-analysis of a case,
+retries after a downstream failure) only burns tokens and rate-limit budget. The raw
+completion text is stored, keyed by a SHA-256 of the full request payload (model,
+temperature, messages, response format), and re-parsed by the caller on a hit so
+every caller still gets its own model instance.
+
+Matching is exact up to whitespace: text content is canonicalized (runs of spaces and
+newlines collapsed) before hashing, so re-submitted drafts that only differ in spacing
+hit. There is deliberately no embedding/fuzzy lookup: a "95% similar" report can differ
+in exactly the amount, date or name the summary must reproduce. No Redis in this
+deployment, so each worker process has its own cache.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+import orjson
+
+from app.core.config import settings
+
+
+class LLMResponseCache:
+    """
+    LRU + TTL map: sha256(payload) -> (expires, content).
+    """
+
+    MAX_ENTRIES = 1024
+
+    _entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    @staticmethod
+    def _canonical_message(message: Dict[str, Any]) -> Dict[str, Any]:
+        content = message.get("content")
+        if isinstance(content, str):
+            return {**message, "content": " ".join(content.split())}
+        return message  # Multimodal parts (image data URLs) are hashed as-is
+
+    @classmethod
+    def key(cls, payload: Dict[str, Any]) -> bytes:
+        canonical = {**payload, "messages": [cls._canonical_message(m) for m in payload["messages"]]}
+        return hashlib.sha256(orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)).digest()
+
+    @classmethod
+    def get(cls, key: bytes) -> Optional[str]:
+        entry = cls._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del cls._entries[key]
+            return None
+        cls._entries.move_to_end(key)
+        return entry[1]
+
+    @classmethod
+    def put(cls, key: bytes, content: str):
+        if settings.GROQ_CACHE_TTL_SECONDS <= 0:
+            return
+        cls._entries[key] = (time.monotonic() + settings.GROQ_CACHE_TTL_SECONDS, content)
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > cls.MAX_ENTRIES:
+            cls._entries.popitem(last=False)
@@ -5,15 +5,14 @@ from sqlalchemy import select, update
 from fastapi.concurrency import run_in_threadpool
 from app.services.ai_service import GroqService
 from app.services.evidence_processor import EvidenceProcessor
+from app.schemas.ai import EvidenceMetadata
 from app.models.beacon import Beacon
 from app.db.session import AsyncSessionLocal
 from app.db.local_db import LocalAsyncSession
 from app.models.local_models import LocalConversation, LocalEvidence, LocalSenderType
 import structlog
 import asyncio
-import json
 import os
-from datetime import datetime, timezone
 
 logger = structlog.get_logger()
 
@@ -22,6 +21,18 @@ class ScoringService:
     Phase 2: Asynchronous Analysis Engine (Two-Layer Architecture).
     """
     
+    @staticmethod
+    def _scoring_metadata(evidence_count: int, evidence_metadata: List[EvidenceMetadata]) -> Dict[str, Any]:
+        """
+        METADATA block of the scoring prompt. It must be byte-identical for identical cases so
+        re-runs hit the Groq prefix cache and LLMResponseCache: no wall-clock timestamp, and no
+        file_path (remote evidence is analysed from a fresh temp file on every run).
+        """
+        return {
+            "evidence_count": evidence_count,
+            "layer1_flags": [m.model_dump(exclude={"file_path"}) for m in evidence_metadata],
+        }
+
     @staticmethod
     async def run_background_scoring(session_id: str, case_id: str):
         """
@@ -33,6 +44,7 @@ class ScoringService:
         try:
             async with AsyncSessionLocal() as supabase_session:
                 async with LocalAsyncSession() as local_session:
+                    summary_task = None
                     try:
                         # 1. Fetch Raw Data
                         chat_history = await ScoringService._fetch_chat_history(session_id, local_session)
@@ -41,6 +53,24 @@ class ScoringService:
                         if not chat_history:
                             raise ValueError("No chat history found for analysis.")
 
+                        backoff_times = [5, 15, 30]
+                        # Summary (with retries) and scoring share one formatted transcript
+                        conversation_text = GroqService.format_history(chat_history)
+
+                        async def summary_with_retry():
+                            # Exponential backoff on rate limits
+                            for attempt in range(len(backoff_times)):
+                                result = await GroqService.generate_pro_summary(chat_history, conversation_text)
+                                if result:
+                                    return result
+                                logger.info("background_scoring_summary_retry", case_id=case_id, attempt=attempt+1, delay=backoff_times[attempt])
+                                await asyncio.sleep(backoff_times[attempt])
+                            return None
+
+                        # The summary only needs the chat: start it now so the Groq call overlaps
+                        # evidence download and Layer 1 processing (OCR, transcription) below
+                        summary_task = asyncio.create_task(summary_with_retry())
+
                         # 1.5 Ensure evidence is local for processing (Download if needed)
                         import tempfile
                         from app.services.storage_service import StorageService
@@ -93,62 +123,64 @@ class ScoringService:
                         # 2. Layer 1: Deterministic Evidence Processing
                         evidence_metadata = await run_in_threadpool(EvidenceProcessor.process_evidence, evidence_objs)
                                 
-                        # 3. Layer 2: AI Reasoning (with exponential backoff)
-                        summary = None
-                        backoff_times = [5, 15, 30]
-                        for attempt in range(len(backoff_times)):
-                            summary = await GroqService.generate_pro_summary(chat_history)
-                            if summary: break
-                            
-                            logger.info("background_scoring_summary_retry", case_id=case_id, attempt=attempt+1, delay=backoff_times[attempt])
-                            await asyncio.sleep(backoff_times[attempt])
+                        # 3. Layer 2: AI Reasoning
+                        # Independent Groq calls run concurrently (GroqService caps in-flight
+                        # requests with its semaphore): summary (already running) || visual analysis
+                        # of every image, then OCR/audio forensics (they need the summary) at once.
+                        async def visual_analysis(ev):
+                            try:
+                                if ev.file_path.startswith("supastorage://"):
+                                    parts = ev.file_path.replace("supastorage://", "").split("/", 1)
+                                    img_content = await run_in_threadpool(StorageService.download_file, parts[0], parts[1])
+                                else:
+                                    img_content = await run_in_threadpool(lambda: open(ev.file_path, "rb").read())
+
+                                visual_desc = await GroqService.perform_forensic_visual_analysis(
+                                    image_bytes=img_content,
+                                    mime_type="image/png" if ev.file_name.lower().endswith(".png") else "image/jpeg"
+                                )
+                                if visual_desc: ev.object_labels.append(f"context: {visual_desc}")
+                            except Exception: pass
+
+                        summary, *_ = await asyncio.gather(
+                            summary_task,
+                            *(visual_analysis(ev) for ev in evidence_metadata if ev.file_type == "image"),
+                        )
                         
                         if not summary:
                              raise ValueError("AI Summary returned None after retries (Rate Limited).")
 
-                        # 3a. Forensic Enrichment (OCR, Audio, Visual)
+                        # 3a. Forensic Enrichment (OCR, Audio)
+                        async def ocr_analysis(ev):
+                            analysis = await GroqService.perform_forensic_ocr_analysis(
+                                ocr_text=ev.ocr_text_snippet,
+                                narrative_summary=summary
+                            )
+                            if analysis: ev.forensic_analysis = analysis
+
+                        async def audio_analysis(ev):
+                            audio_result = await GroqService.perform_forensic_audio_analysis(
+                                transcript_text=ev.audio_transcript_snippet,
+                                narrative_summary=summary,
+                                audio_metadata={"clarity": "medium"}
+                            )
+                            if audio_result: ev.forensic_audio_analysis = audio_result
+
+                        enrichment = []
                         for ev in evidence_metadata:
                             if ev.file_type == "image" and ev.ocr_text_snippet and len(ev.ocr_text_snippet) > 10:
-                                analysis = await GroqService.perform_forensic_ocr_analysis(
-                                    ocr_text=ev.ocr_text_snippet,
-                                    narrative_summary=summary
-                                )
-                                if analysis: ev.forensic_analysis = analysis
-                            
+                                enrichment.append(ocr_analysis(ev))
                             if ev.file_type == "audio" and ev.audio_transcript_snippet and len(ev.audio_transcript_snippet) > 10:
                                 if not ev.audio_transcript_snippet.startswith("["):
-                                    audio_analysis = await GroqService.perform_forensic_audio_analysis(
-                                        transcript_text=ev.audio_transcript_snippet,
-                                        narrative_summary=summary,
-                                        audio_metadata={"clarity": "medium"}
-                                    )
-                                    if audio_analysis: ev.forensic_audio_analysis = audio_analysis
-                            
-                            if ev.file_type == "image":
-                                try:
-                                    img_content = None
-                                    if ev.file_path.startswith("supastorage://"):
-                                        parts = ev.file_path.replace("supastorage://", "").split("/", 1)
-                                        img_content = await run_in_threadpool(StorageService.download_file, parts[0], parts[1])
-                                    else:
-                                        img_content = await run_in_threadpool(lambda: open(ev.file_path, "rb").read())
-
-                                    visual_desc = await GroqService.perform_forensic_visual_analysis(
-                                        image_bytes=img_content,
-                                        mime_type="image/png" if ev.file_name.lower().endswith(".png") else "image/jpeg"
-                                    )
-                                    if visual_desc: ev.object_labels.append(f"context: {visual_desc}")
-                                except Exception: pass
-
-                        metadata_context = {
-                            "evidence_count": len(evidence_objs),
-                            "timestamp": str(datetime.now(timezone.utc)),
-                            "layer1_flags": [m.model_dump() for m in evidence_metadata]
-                        }
+                                    enrichment.append(audio_analysis(ev))
+                        # Best-effort: one failed forensic call must not sink the whole case
+                        await GroqService.run_parallel(*enrichment)
+
+                        metadata_context = ScoringService._scoring_metadata(len(evidence_objs), evidence_metadata)
                         
                         score_result = None
                         for attempt in range(len(backoff_times)):
-                            score_result = await GroqService.calculate_credibility_score(chat_history, evidence_metadata, metadata_context)
+                            score_result = await GroqService.calculate_credibility_score(chat_history, evidence_metadata, metadata_context, conversation_text)
                             if score_result: break
                             
                             logger.info("background_scoring_calc_retry", case_id=case_id, attempt=attempt+1, delay=backoff_times[attempt])
@@ -158,7 +190,7 @@ class ScoringService:
                              raise ValueError("AI Scoring returned None after retries (Rate Limited).")
 
                         # 4. Strict Validation & Update
-                        score = max(1, min(100, score_result.credibility_score))
+                        score = score_result.credibility_score  # Clamped to 1-100 by ScoringResult
                         breakdown_json = {
                             "narrative": score_result.narrative_credibility.model_dump(),
                             "evidence": score_result.evidence_strength.model_dump(),
@@ -188,6 +220,8 @@ class ScoringService:
                         logger.info("phase2_analysis_success", case_id=case_id, score=score)
                         
                     except Exception as e:
+                        if summary_task is not None:
+                            summary_task.cancel()
                         logger.error("phase2_analysis_failed", case_id=case_id, error=str(e))
                         await ScoringService._record_failure(case_id, str(e), supabase_session)
         except Exception as outer_e:
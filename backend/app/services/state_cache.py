@@ -0,0 +1,61 @@
+"""
+In-process cache of LocalStateTracking.context_data for active chat sessions.
+
+Every chat turn used to SELECT + JSON-decode the session state and JSON-encode +
+UPDATE it again. The parsed dict is kept here instead, so the SELECT is skipped and
+turns that change nothing skip the UPDATE. Changed state is still written through
+to SQLite on the same turn: another worker process may serve the next turn, and an
+entry dropped by the TTL/LRU or a restart must never hold unsaved facts.
+
+Entries are validated against the conversation length the caller has already
+loaded, so a session served by another worker process in between is reloaded from
+the database instead of using a stale copy.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+
+class SessionStateCache:
+    """
+    LRU + TTL map: session_id -> {"context_data", "history_len", "expires"}.
+    Holds only state that is already persisted, so dropping an entry never loses data.
+    """
+
+    MAX_ENTRIES = 4096
+    TTL_SECONDS = 900
+
+    _entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @classmethod
+    def get(cls, session_id: str, history_len: int) -> Optional[Dict[str, Any]]:
+        """
+        Cached context_data, or None if missing, expired or stale (history_len mismatch).
+        """
+        entry = cls._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry["expires"] < time.monotonic() or entry["history_len"] != history_len:
+            del cls._entries[session_id]
+            return None
+        cls._entries.move_to_end(session_id)
+        return entry["context_data"]
+
+    @classmethod
+    def put(cls, session_id: str, context_data: Dict[str, Any], history_len: int):
+        """
+        Store context_data (as persisted) as it will look once history_len messages exist.
+        """
+        cls._entries.pop(session_id, None)
+        cls._entries[session_id] = {
+            "context_data": context_data,
+            "history_len": history_len,
+            "expires": time.monotonic() + cls.TTL_SECONDS,
+        }
+        while len(cls._entries) > cls.MAX_ENTRIES:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def evict(cls, session_id: str):
+        cls._entries.pop(session_id, None)
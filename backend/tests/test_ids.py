@@ -0,0 +1,54 @@
+"""
+uuid7(): RFC 9562 layout and per-process ordering.
+"""
+import threading
+import time
+import uuid
+
+from app.core import ids
+from app.core.ids import uuid7
+
+
+def test_version_and_variant_bits():
+    for _ in range(1000):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+def test_timestamp_is_unix_ms():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    # A clock that didn't advance can only push the id forward, never before `before`
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_monotonic_within_the_same_millisecond(monkeypatch):
+    frozen = time.time_ns()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: frozen)
+    values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert all(v.version == 7 and v.variant == uuid.RFC_4122 for v in values)
+
+
+def test_monotonic_when_the_clock_steps_back(monkeypatch):
+    now = time.time_ns()
+    first = uuid7()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: now - 60 * 1_000_000_000)
+    assert uuid7() > first
+
+
+def test_unique_across_threads():
+    results = []
+
+    def worker():
+        results.extend(uuid7() for _ in range(2000))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == len(results)
@@ -0,0 +1,45 @@
+"""
+ReportEngine chat turns: the user message is buffered and written together with the
+reply in one multi-row INSERT; history must still come back in conversation order.
+"""
+import asyncio
+import uuid
+
+from sqlalchemy import select
+
+from app.models.local_models import LocalConversation, LocalSenderType
+from app.services.llm_agent import LLMAgent
+from app.services.report_engine import ReportEngine
+
+
+def test_turn_rows_come_back_in_created_at_order(local_staging, monkeypatch):
+    report_id = str(uuid.uuid4())
+    histories = []
+
+    async def fake_chat(history, current_state):
+        histories.append([message["content"] for message in history])
+        return f"reply {len(histories) - 1}", {}
+
+    monkeypatch.setattr(LLMAgent, "chat", fake_chat)
+
+    async def scenario():
+        await ReportEngine.initialize_report(report_id, "token")
+        for turn in range(3):
+            await ReportEngine.process_message(report_id, f"message {turn}", supabase_session=None)
+        async with local_staging() as session:
+            rows = (await session.execute(
+                select(LocalConversation).where(LocalConversation.session_id == report_id).order_by(LocalConversation.created_at)
+            )).scalars().all()
+        return rows
+
+    rows = asyncio.run(scenario())
+
+    assert [(row.sender, row.content) for row in rows] == [
+        (LocalSenderType.USER, "message 0"), (LocalSenderType.SYSTEM, "reply 0"),
+        (LocalSenderType.USER, "message 1"), (LocalSenderType.SYSTEM, "reply 1"),
+        (LocalSenderType.USER, "message 2"), (LocalSenderType.SYSTEM, "reply 2"),
+    ]
+    # The user message is stamped before the LLM call, the reply after it
+    assert all(earlier.created_at < later.created_at for earlier, later in zip(rows, rows[1:]))
+    # Each turn sees the earlier turns in order, then its own (not yet stored) message
+    assert histories[2] == ["message 0", "reply 0", "message 1", "reply 1", "message 2"]
@@ -0,0 +1,80 @@
+"""
+LLMResponseCache: whitespace-insensitive exact matching, TTL and LRU bounds.
+"""
+from collections import OrderedDict
+
+import pytest
+
+from app.core.config import settings
+from app.services import response_cache
+from app.services.response_cache import LLMResponseCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(LLMResponseCache, "_entries", OrderedDict())
+    monkeypatch.setattr(settings, "GROQ_CACHE_TTL_SECONDS", 60)
+
+
+def _payload(content, model="llama-3.1-8b-instant", **extra):
+    return {"model": model, "temperature": 0.1, "messages": [{"role": "user", "content": content}], **extra}
+
+
+def test_whitespace_only_changes_hit():
+    LLMResponseCache.put(LLMResponseCache.key(_payload("Bribe paid at the\nRTO office")), "cached")
+    for variant in ("Bribe  paid at the RTO office", "  Bribe paid\tat the\n\nRTO office \n"):
+        assert LLMResponseCache.get(LLMResponseCache.key(_payload(variant))) == "cached"
+
+
+def test_content_changes_miss():
+    LLMResponseCache.put(LLMResponseCache.key(_payload("Paid 5000 rupees")), "cached")
+    # Whitespace inside a word is not "only whitespace": the tokens differ
+    for variant in ("Paid 5001 rupees", "Paid 50 00 rupees", "paid 5000 rupees"):
+        assert LLMResponseCache.get(LLMResponseCache.key(_payload(variant))) is None
+
+
+def test_request_options_are_part_of_the_key():
+    base = LLMResponseCache.key(_payload("text"))
+    assert LLMResponseCache.key(_payload("text", model="other-model")) != base
+    assert LLMResponseCache.key(_payload("text", response_format={"type": "json_object"})) != base
+    assert LLMResponseCache.key({**_payload("text"), "temperature": 0.7}) != base
+
+
+def test_multimodal_parts_are_hashed_as_is():
+    def image_payload(text):
+        parts = [{"type": "text", "text": text}, {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}}]
+        return {"model": "vision", "messages": [{"role": "user", "content": parts}]}
+
+    assert LLMResponseCache.key(image_payload("describe")) == LLMResponseCache.key(image_payload("describe"))
+    assert LLMResponseCache.key(image_payload("describe")) != LLMResponseCache.key(image_payload("describe "))
+
+
+def test_expired_entries_miss(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    key = LLMResponseCache.key(_payload("text"))
+    LLMResponseCache.put(key, "cached")
+    now[0] += 59
+    assert LLMResponseCache.get(key) == "cached"
+    now[0] += 2
+    assert LLMResponseCache.get(key) is None
+    assert key not in LLMResponseCache._entries
+
+
+def test_zero_ttl_disables_caching(monkeypatch):
+    monkeypatch.setattr(settings, "GROQ_CACHE_TTL_SECONDS", 0)
+    key = LLMResponseCache.key(_payload("text"))
+    LLMResponseCache.put(key, "cached")
+    assert LLMResponseCache.get(key) is None
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(LLMResponseCache, "MAX_ENTRIES", 2)
+    first, second, third = (LLMResponseCache.key(_payload(text)) for text in ("one", "two", "three"))
+    LLMResponseCache.put(first, "1")
+    LLMResponseCache.put(second, "2")
+    assert LLMResponseCache.get(first) == "1"  # first is now the most recently used
+    LLMResponseCache.put(third, "3")
+    assert LLMResponseCache.get(second) is None
+    assert LLMResponseCache.get(first) == "1"
+    assert LLMResponseCache.get(third) == "3"
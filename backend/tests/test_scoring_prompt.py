@@ -0,0 +1,50 @@
+"""
+Scoring prompt stability: re-scoring the same case must send byte-identical messages,
+otherwise it never hits LLMResponseCache or the Groq prefix cache.
+"""
+import asyncio
+import shutil
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from app.services.ai_service import GroqService
+from app.services.evidence_processor import EvidenceProcessor
+from app.services.scoring_service import ScoringService
+
+CHAT = [
+    {"role": "user", "content": "The clerk asked for 2000 rupees to release my file."},
+    {"role": "assistant", "content": "Where did this happen?"},
+    {"role": "user", "content": "At the municipal office, last Tuesday."},
+]
+
+
+def _score_once(tmp_path, run, image_path, monkeypatch):
+    # Remote evidence is downloaded to a fresh temp file on every scoring run
+    local_copy = tmp_path / f"run{run}-download.png"
+    shutil.copy(image_path, local_copy)
+    evidence = [SimpleNamespace(file_name="receipt.png", file_path=str(local_copy), mime_type="image/png")]
+    evidence_metadata = EvidenceProcessor.process_evidence(evidence)
+
+    sent = []
+
+    async def fake_call_groq(messages, *args, **kwargs):
+        sent.append(messages)
+        return None
+
+    monkeypatch.setattr(GroqService, "_call_groq", fake_call_groq)
+    metadata = ScoringService._scoring_metadata(len(evidence), evidence_metadata)
+    asyncio.run(GroqService.calculate_credibility_score(CHAT, evidence_metadata, metadata))
+    return sent[0]
+
+
+def test_rescoring_the_same_case_sends_identical_prompts(tmp_path, monkeypatch):
+    image_path = tmp_path / "receipt.png"
+    cv2.imwrite(str(image_path), np.full((64, 64, 3), 200, dtype=np.uint8))
+
+    first = _score_once(tmp_path, 1, image_path, monkeypatch)
+    second = _score_once(tmp_path, 2, image_path, monkeypatch)
+
+    assert first == second
+    assert "download.png" not in first[-1]["content"]
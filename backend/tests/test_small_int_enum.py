@@ -0,0 +1,56 @@
+"""
+SmallIntEnum codes are stored data: these pins fail if a code is changed or reused.
+"""
+import enum
+
+import pytest
+
+from app.db.types import SmallIntEnum
+from app.models.local_models import LocalSenderType, LOCAL_SENDER_CODES
+from app.models.report import (
+    ReportStatus, ReportPriority, SenderType,
+    REPORT_STATUS_CODES, REPORT_PRIORITY_CODES, SENDER_TYPE_CODES,
+)
+
+
+def _by_name(codes):
+    return {member.name: code for member, code in codes.items()}
+
+
+def test_stored_codes_are_pinned():
+    assert _by_name(REPORT_STATUS_CODES) == {
+        "NEW": 0, "ANALYZING": 1, "VERIFIED": 2, "IN_REVIEW": 3,
+        "ESCALATED": 4, "CLOSED": 5, "DISMISSED": 6,
+    }
+    assert _by_name(REPORT_PRIORITY_CODES) == {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
+    assert _by_name(SENDER_TYPE_CODES) == {"USER": 0, "AI": 1, "SYSTEM": 2}
+    assert _by_name(LOCAL_SENDER_CODES) == {"USER": 0, "AI": 1, "SYSTEM": 2}
+
+
+@pytest.mark.parametrize("enum_class, codes", [
+    (ReportStatus, REPORT_STATUS_CODES),
+    (ReportPriority, REPORT_PRIORITY_CODES),
+    (SenderType, SENDER_TYPE_CODES),
+    (LocalSenderType, LOCAL_SENDER_CODES),
+])
+def test_round_trip(enum_class, codes):
+    column_type = SmallIntEnum(enum_class, codes)
+    for member in enum_class:
+        stored = column_type.process_bind_param(member.value, None)
+        assert stored == codes[member]
+        assert column_type.process_result_value(stored, None) is member
+
+
+class _Color(str, enum.Enum):
+    RED = "RED"
+    BLUE = "BLUE"
+
+
+def test_rejects_unmapped_member():
+    with pytest.raises(ValueError, match="BLUE"):
+        SmallIntEnum(_Color, {_Color.RED: 0})
+
+
+def test_rejects_duplicate_codes():
+    with pytest.raises(ValueError, match="unique"):
+        SmallIntEnum(_Color, {_Color.RED: 0, _Color.BLUE: 0})
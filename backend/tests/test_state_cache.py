@@ -0,0 +1,134 @@
+"""
+SessionStateCache: stale entries are rejected, changed state is written through on
+the same turn, and ReportEngine reloads state another worker has written.
+"""
+import asyncio
+import uuid
+from collections import OrderedDict
+
+import pytest
+from sqlalchemy import insert, select, update
+
+from app.core.time_utils import get_utc_now
+from app.models.local_models import LocalConversation, LocalSenderType, LocalStateTracking
+from app.services import state_cache
+from app.services.llm_agent import LLMAgent
+from app.services.report_engine import ReportEngine
+from app.services.state_cache import SessionStateCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(SessionStateCache, "_entries", OrderedDict())
+
+
+def test_history_len_mismatch_rejects_and_drops_entry():
+    SessionStateCache.put("s", {"extracted": {"a": 1}}, history_len=4)
+    assert SessionStateCache.get("s", 4) == {"extracted": {"a": 1}}
+    # Another worker stored a turn: the conversation is longer than the cached state expects
+    assert SessionStateCache.get("s", 6) is None
+    assert SessionStateCache.get("s", 4) is None
+
+
+def test_expired_entry_is_rejected(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(state_cache.time, "monotonic", lambda: now[0])
+    SessionStateCache.put("s", {}, history_len=2)
+    now[0] += SessionStateCache.TTL_SECONDS + 1
+    assert SessionStateCache.get("s", 2) is None
+
+
+def test_lru_drops_the_oldest_entry(monkeypatch):
+    monkeypatch.setattr(SessionStateCache, "MAX_ENTRIES", 2)
+    for session_id in ("a", "b"):
+        SessionStateCache.put(session_id, {}, history_len=2)
+    assert SessionStateCache.get("a", 2) == {}  # a is now the most recently used
+    SessionStateCache.put("c", {}, history_len=2)
+    assert SessionStateCache.get("b", 2) is None
+    assert SessionStateCache.get("a", 2) == {}
+
+
+def _stub_llm(monkeypatch, replies, seen_states):
+    async def fake_chat(history, current_state):
+        seen_states.append(dict(current_state))
+        return "noted", replies.pop(0)
+
+    monkeypatch.setattr(LLMAgent, "chat", fake_chat)
+
+
+async def _stored_extracted(session_factory, report_id):
+    async with session_factory() as session:
+        state = (await session.execute(
+            select(LocalStateTracking).where(LocalStateTracking.session_id == report_id)
+        )).scalar_one()
+    return state.context_data["extracted"]
+
+
+def test_engine_writes_changed_state_on_the_same_turn(local_staging, monkeypatch):
+    report_id = str(uuid.uuid4())
+    seen_states = []
+    _stub_llm(monkeypatch, [{"turn": "1"}, {}, {"turn": "3"}], seen_states)
+
+    async def scenario():
+        await ReportEngine.initialize_report(report_id, "token")
+        stored = []
+        for turn in range(1, 4):
+            await ReportEngine.process_message(report_id, f"message {turn}", supabase_session=None)
+            stored.append(await _stored_extracted(local_staging, report_id))
+        return stored
+
+    stored = asyncio.run(scenario())
+
+    # No turn leaves unsaved facts behind in the cache
+    assert stored == [{"turn": "1"}, {"turn": "1"}, {"turn": "3"}]
+    assert seen_states == [{}, {"turn": "1"}, {"turn": "1"}]
+
+
+def test_engine_skips_the_update_for_unchanged_turns(local_staging, monkeypatch):
+    report_id = str(uuid.uuid4())
+    _stub_llm(monkeypatch, [{"location": "Pune"}, {}], [])
+
+    async def scenario():
+        await ReportEngine.initialize_report(report_id, "token")
+        await ReportEngine.process_message(report_id, "It happened in Pune", supabase_session=None)
+        # Changed behind the engine's back without adding a turn: the cached copy is still
+        # valid, so an unchanged turn must neither read nor overwrite the row
+        async with local_staging() as session:
+            await session.execute(
+                update(LocalStateTracking)
+                .where(LocalStateTracking.session_id == report_id)
+                .values(context_data={"extracted": {"marker": "untouched"}})
+            )
+            await session.commit()
+        await ReportEngine.process_message(report_id, "That is all", supabase_session=None)
+        return await _stored_extracted(local_staging, report_id)
+
+    assert asyncio.run(scenario()) == {"marker": "untouched"}
+
+
+def test_engine_reloads_state_written_by_another_worker(local_staging, monkeypatch):
+    report_id = str(uuid.uuid4())
+    seen_states = []
+    _stub_llm(monkeypatch, [{"location": "Pune"}, {}], seen_states)
+
+    async def scenario():
+        await ReportEngine.initialize_report(report_id, "token")
+        await ReportEngine.process_message(report_id, "It happened in Pune", supabase_session=None)
+        # Another worker process handles a turn for this session: it stores the turn
+        # and persists its own state, none of which this process's cache has seen
+        async with local_staging() as session:
+            await session.execute(insert(LocalConversation), [
+                {"session_id": report_id, "sender": LocalSenderType.USER, "content": "Actually Mumbai", "created_at": get_utc_now()},
+                {"session_id": report_id, "sender": LocalSenderType.SYSTEM, "content": "noted", "created_at": get_utc_now()},
+            ])
+            await session.execute(
+                update(LocalStateTracking)
+                .where(LocalStateTracking.session_id == report_id)
+                .values(context_data={"extracted": {"location": "Mumbai"}})
+            )
+            await session.commit()
+        await ReportEngine.process_message(report_id, "The officer asked for cash", supabase_session=None)
+
+    asyncio.run(scenario())
+
+    assert seen_states == [{}, {"location": "Mumbai"}]
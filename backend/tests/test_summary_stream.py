@@ -0,0 +1,37 @@
+"""
+generate_pro_summary_stream: title prefixes are stripped from the held-back head
+without touching the whitespace that joins it to the next delta.
+"""
+import asyncio
+
+import pytest
+
+from app.services.ai_service import GroqService
+
+
+def _collect(monkeypatch, chunks):
+    async def fake_stream_groq(messages, model, max_tokens):
+        for chunk in chunks:
+            yield chunk
+
+    monkeypatch.setattr(GroqService, "_stream_groq", fake_stream_groq)
+
+    async def run():
+        return [delta async for delta in GroqService.generate_pro_summary_stream([{"role": "user", "content": "x"}])]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("chunks, expected", [
+    # The head is released mid-sentence, right after a word boundary
+    (["Summary: The ", "clerk ", "officer ", "asked for cash."], "The clerk officer asked for cash."),
+    (["  Intelligence Summary:\n", "The officer ", "asked for cash."], "The officer asked for cash."),
+    (["The complainant ", "reports a bribe."], "The complainant reports a bribe."),
+    (["Summary: ", "Short."], "Short."),
+])
+def test_prefix_is_stripped_and_words_stay_separated(monkeypatch, chunks, expected):
+    assert "".join(_collect(monkeypatch, chunks)) == expected
+
+
+def test_empty_stream_yields_placeholder(monkeypatch):
+    assert _collect(monkeypatch, []) == ["No summary generated."]
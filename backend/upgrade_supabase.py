@@ -18,6 +18,101 @@ async def upgrade():
             # But the requirement said authority_summary is stored separately from user-facing data.
             # We already removed score_explanation from the Beacon model.
             
+            # Column defaults for rows inserted outside the ORM (the models set ids/timestamps in Python)
+            print("Setting id/timestamp column defaults...")
+            for table in ("admins", "beacon", "beacon_update", "beacon_message"):
+                await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid();"))
+                await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now();"))
+            for table in ("admins", "beacon"):
+                await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now();"))
+            await conn.execute(text("ALTER TABLE beacon ALTER COLUMN last_updated_at SET DEFAULT now();"))
+
+            # json -> jsonb (binary storage, no reparse on read, GIN-indexable)
+            print("Converting JSON columns to JSONB...")
+            await conn.execute(text("ALTER TABLE beacon ALTER COLUMN evidence_files TYPE JSONB USING evidence_files::jsonb;"))
+            await conn.execute(text("ALTER TABLE beacon ALTER COLUMN credibility_breakdown TYPE JSONB USING credibility_breakdown::jsonb;"))
+            await conn.execute(text("ALTER TABLE beacon_message ALTER COLUMN attachments TYPE JSONB USING attachments::jsonb;"))
+
+            # Access-pattern indexes (admin list, pending queue, message/update timelines)
+            print("Creating access-pattern indexes...")
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_reported_at ON beacon (reported_at);"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_status_reported_at ON beacon (analysis_status, reported_at);"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_pending_reported_at ON beacon (reported_at) WHERE analysis_status = 'pending';"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_message_case_created ON beacon_message (case_id, created_at);"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_update_case_created ON beacon_update (case_id, created_at);"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS idx_beacon_credibility_breakdown_gin ON beacon USING gin (credibility_breakdown jsonb_path_ops);"))
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_beacon_credibility_score ON beacon (credibility_score);"))
+
+            # Case IDs come from a sequence (app.services.case_service): positioned after the
+            # highest existing BCN number so issued IDs never collide with old rows
+            print("Creating case ID sequence...")
+            await conn.execute(text("CREATE SEQUENCE IF NOT EXISTS beacon_case_id_seq START 100000000001;"))
+            await conn.execute(text(
+                "SELECT setval('beacon_case_id_seq', GREATEST("
+                "(SELECT max(substring(case_id FROM 4)::bigint) FROM beacon WHERE case_id ~ '^BCN[0-9]{12}$'), "
+                "(SELECT last_value FROM beacon_case_id_seq WHERE is_called), 100000000000));"
+            ))
+
+            # lz4 TOAST compression (PG14+) for the large free-text/JSON columns; ~2x faster than pglz.
+            # Applies to newly written values; existing rows keep pglz until rewritten.
+            print("Switching large columns to lz4 compression...")
+            for table, column in (
+                ("beacon", "credibility_breakdown"),
+                ("beacon", "authority_summary"),
+                ("beacon", "incident_summary"),
+                ("beacon_message", "content"),
+            ):
+                await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4;"))
+
+            # Legacy reports tables (only present if app/init_db.py was run): JSONB + GIN containment indexes
+            if (await conn.execute(text("SELECT to_regclass('public.reports')"))).scalar():
+                print("Converting reports JSON columns to JSONB + GIN indexes...")
+                for column in ("credibility_breakdown", "categories", "location_meta", "evidence_analysis", "tone_analysis"):
+                    await conn.execute(text(f"ALTER TABLE reports ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb;"))
+                for column in ("categories", "credibility_breakdown", "evidence_analysis", "location_meta"):
+                    await conn.execute(text(f"CREATE INDEX IF NOT EXISTS idx_reports_{column}_gin ON reports USING gin ({column} jsonb_path_ops);"))
+                await conn.execute(text("ALTER TABLE report_state_tracking ALTER COLUMN context_data TYPE JSONB USING context_data::jsonb;"))
+                await conn.execute(text("CREATE INDEX IF NOT EXISTS idx_report_state_tracking_context_data_gin ON report_state_tracking USING gin (context_data jsonb_path_ops);"))
+                await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_report_conversations_report_created ON report_conversations (report_id, created_at);"))
+                await conn.execute(text("ALTER TABLE report_conversations ALTER COLUMN content_redacted SET COMPRESSION lz4;"))
+
+                # Native enum types -> SMALLINT codes (see app/db/types.SmallIntEnum)
+                from app.models.report import Report, ReportConversation
+                for table, column in (
+                    ("reports", Report.__table__.c.status),
+                    ("reports", Report.__table__.c.priority),
+                    ("report_conversations", ReportConversation.__table__.c.sender),
+                ):
+                    is_enum = (await conn.execute(text(
+                        "SELECT data_type = 'USER-DEFINED' FROM information_schema.columns "
+                        "WHERE table_name = :t AND column_name = :c"
+                    ), {"t": table, "c": column.name})).scalar()
+                    if not is_enum:
+                        continue
+                    case = " ".join(f"WHEN '{m.name}' THEN {code}" for m, code in column.type.codes.items())
+                    await conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column.name} TYPE SMALLINT "
+                        f"USING (CASE {column.name}::text {case} END);"
+                    ))
+                for enum_type in ("reportstatus", "reportpriority", "sendertype"):
+                    await conn.execute(text(f"DROP TYPE IF EXISTS {enum_type};"))
+
+                # Access-token lookups: partial unique index over open reports only
+                from app.models.report import ReportStatus, REPORT_STATUS_CODES as codes
+                await conn.execute(text("DROP INDEX IF EXISTS ix_reports_access_token_hash;"))
+                # Hex text -> raw SHA-256 bytes (half the index width)
+                for table, column in (("reports", "access_token_hash"), ("evidence", "file_hash")):
+                    is_text = (await conn.execute(text(
+                        "SELECT data_type <> 'bytea' FROM information_schema.columns "
+                        "WHERE table_name = :t AND column_name = :c"
+                    ), {"t": table, "c": column})).scalar()
+                    if is_text:
+                        await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BYTEA USING decode({column}, 'hex');"))
+                await conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ix_reports_token_open ON reports (access_token_hash) "
+                    f"WHERE status NOT IN ({codes[ReportStatus.CLOSED]}, {codes[ReportStatus.DISMISSED]});"
+                ))
+
             print("✅ Database Upgrade Successful!")
         except Exception as e:
             print(f"❌ Database Upgrade Failed: {e}")
@@ -3,8 +3,8 @@
 
 import { useEffect, useState, useCallback } from "react";
 import { useParams, useRouter } from "next/navigation";
-import { api } from "@/lib/api";
-import { ArrowLeft, Send, Clock, AlertTriangle, FileText, ChevronDown, Shield, Paperclip } from "lucide-react";
+import { api, streamEvents } from "@/lib/api";
+import { ArrowLeft, Send, Clock, AlertTriangle, FileText, ChevronDown, Shield, Paperclip, RefreshCw } from "lucide-react";
 import { clsx } from "clsx";
 import { formatToIST } from "@/lib/utils";
 
@@ -76,6 +76,10 @@ export default function CaseDetailPage() {
     const [submitting, setSubmitting] = useState(false);
     const [submitSuccess, setSubmitSuccess] = useState(false);
 
+    // Regenerated summary, streamed in as the model writes it (preview only, not saved)
+    const [streamedSummary, setStreamedSummary] = useState<string | null>(null);
+    const [summaryStreaming, setSummaryStreaming] = useState(false);
+
     const fetchCaseData = useCallback(async () => {
         try {
             // Parallelize fetches for better performance
@@ -153,6 +157,22 @@ export default function CaseDetailPage() {
         }
     };
 
+    const regenerateSummary = async () => {
+        setSummaryStreaming(true);
+        setStreamedSummary("");
+        try {
+            await streamEvents(`/admin/reports/${caseId}/summary/stream`, (delta) => {
+                setStreamedSummary((prev) => (prev ?? "") + delta);
+            });
+        } catch (err) {
+            console.error(err);
+            setStreamedSummary(null);
+            alert("Failed to regenerate summary.");
+        } finally {
+            setSummaryStreaming(false);
+        }
+    };
+
     const handlePublishUpdate = async () => {
         if (!updateText.trim()) return;
 
@@ -303,12 +323,25 @@ export default function CaseDetailPage() {
 
                     {/* Incident Summary */}
                     <div className="bg-card border border-border rounded-xl p-6">
-                        <h2 className="text-lg font-semibold text-white mb-4 flex items-center gap-2">
-                            <FileText className="w-5 h-5 text-primary" /> Incident Summary
-                        </h2>
-                        <div className="prose prose-invert max-w-none text-sm leading-relaxed text-gray-300">
-                            {caseData.incident_summary || <span className="italic text-muted-foreground">Analysis pending or summary unavailable.</span>}
+                        <div className="flex items-center justify-between mb-4">
+                            <h2 className="text-lg font-semibold text-white flex items-center gap-2">
+                                <FileText className="w-5 h-5 text-primary" /> Incident Summary
+                            </h2>
+                            <button
+                                disabled={summaryStreaming}
+                                onClick={regenerateSummary}
+                                className="text-[10px] bg-primary/20 hover:bg-primary/30 text-primary border border-primary/30 px-2 py-1 rounded transition-colors flex items-center gap-1 disabled:opacity-50"
+                            >
+                                <RefreshCw className={clsx("w-3 h-3", summaryStreaming && "animate-spin")} />
+                                {summaryStreaming ? "Generating..." : "Regenerate"}
+                            </button>
                         </div>
+                        <div className="prose prose-invert max-w-none text-sm leading-relaxed text-gray-300 whitespace-pre-wrap">
+                            {streamedSummary ?? caseData.incident_summary ?? <span className="italic text-muted-foreground">Analysis pending or summary unavailable.</span>}
+                        </div>
+                        {streamedSummary !== null && !summaryStreaming && (
+                            <p className="mt-3 text-[10px] text-muted-foreground italic">Regenerated preview from the original chat; the stored summary is unchanged.</p>
+                        )}
                     </div>
 
                     {/* Credibility Explanation - Simplified based on requirements */}
@@ -7,8 +7,10 @@ const getBaseUrl = () => {
     return url;
 };
 
+export const API_BASE_URL = getBaseUrl();
+
 export const api = axios.create({
-    baseURL: getBaseUrl(),
+    baseURL: API_BASE_URL,
     headers: {
         "Content-Type": "application/json",
     },
@@ -44,3 +46,37 @@ api.interceptors.response.use(
         return Promise.reject(error);
     }
 );
+
+/**
+ * Read a Server-Sent Events endpoint (axios can't stream response bodies in the browser).
+ * Each `data:` payload is JSON-decoded and passed to onEvent until the server sends [DONE].
+ */
+export async function streamEvents(path: string, onEvent: (data: string) => void, signal?: AbortSignal): Promise<void> {
+    const token = typeof window !== "undefined" ? sessionStorage.getItem("ngo_token") : null;
+    const response = await fetch(`${API_BASE_URL}${path}`, {
+        headers: token ? { Authorization: `Bearer ${token}` } : {},
+        signal,
+    });
+    if (response.status === 401 && typeof window !== "undefined" && !window.location.pathname.startsWith("/login")) {
+        window.location.href = "/login";
+    }
+    if (!response.ok || !response.body) {
+        throw new Error(`Stream request failed with status ${response.status}`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = "";
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) return;
+        buffer += value;
+        const events = buffer.split("\n\n");
+        buffer = events.pop() ?? "";
+        for (const event of events) {
+            if (!event.startsWith("data: ")) continue;
+            const data = event.slice("data: ".length);
+            if (data === "[DONE]") return;
+            onEvent(JSON.parse(data));
+        }
+    }
+}